@@ -6,13 +6,50 @@ Integrates all fixes and addresses all identified issues.
 
 import sys
 import os
+from collections import OrderedDict, deque
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if np is not None and njit is not None:
+    @njit(cache=True)
+    def _grid_coords(left, top, right, bottom, g):
+        """Generate grid line endpoints (x1, y1, x2, y2) in compiled code."""
+        nx = int(right - left) // g + 1
+        ny = int(bottom - top) // g + 1
+        out = np.empty((nx + ny, 4), dtype=np.float32)
+        for i in range(nx):
+            x = left + i * g
+            out[i, 0] = x
+            out[i, 1] = top
+            out[i, 2] = x
+            out[i, 3] = bottom
+        for j in range(ny):
+            y = top + j * g
+            out[nx + j, 0] = left
+            out[nx + j, 1] = y
+            out[nx + j, 2] = right
+            out[nx + j, 3] = y
+        return out
+else:
+    _grid_coords = None
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                               QHBoxLayout, QTextEdit, QPushButton, QLabel, 
                               QGroupBox, QCheckBox, QRadioButton, QButtonGroup,
-                              QGraphicsView, QGraphicsScene, QMessageBox,
-                              QSplitter, QFrame, QScrollArea)
-from PySide6.QtCore import Qt, QTimer, Signal
-from PySide6.QtGui import QFont, QColor, QPalette
+                              QGraphicsView, QGraphicsScene, QGraphicsItem,
+                              QMessageBox, QSplitter, QFrame, QScrollArea,
+                              QListWidget, QTextBrowser)
+from PySide6.QtCore import (Qt, QTimer, QPointF, QLineF, QObject, QRunnable,
+                            QThreadPool, Signal)
+from PySide6.QtGui import QFont, QColor, QPalette, QPainter, QPixmap
+from PySide6.QtOpenGLWidgets import QOpenGLWidget
 
 # Import all corrected components
 from eg_editor import EGEditor
@@ -20,12 +57,41 @@ from clif_parser import ClifParser
 from eg_renderer import EGRenderer
 from graphics_items import InteractionMode
 
+class _ParseTask(QRunnable):
+    """Runs ClifParser.parse on the canvas's single-threaded parse pool.
+
+    Parsing is pure Python (no Qt objects), so it is safe off the GUI
+    thread; the result is delivered back through a queued signal. Tasks
+    must not run concurrently - parse() resets shared parser state and
+    mutates the shared editor model - so the pool is capped at one thread.
+    """
+
+    class Signals(QObject):
+        finished = Signal(dict, int, str)
+
+    def __init__(self, parser, clif_expr, generation):
+        super().__init__()
+        self.parser = parser
+        self.clif_expr = clif_expr
+        self.generation = generation
+        self.signals = _ParseTask.Signals()
+
+    def run(self):
+        # Snapshot: the result is cached and must outlive later parses
+        result = self.parser.parse(self.clif_expr, snapshot=True)
+        self.signals.finished.emit(result, self.generation, self.clif_expr)
+
 class BullpenCanvas(QGraphicsView):
     """Canvas with all fixes applied."""
-    
+
+    render_finished = Signal(bool, str, str)  # success, message, expression
+
     def __init__(self, parent=None):
         super().__init__(parent)
         
+        # GPU-accelerated viewport; must be set before the scene
+        self.setViewport(QOpenGLWidget())
+
         # Create scene
         self.scene = QGraphicsScene()
         self.setScene(self.scene)
@@ -33,19 +99,46 @@ class BullpenCanvas(QGraphicsView):
         # Canvas properties
         self.setMinimumSize(600, 400)
         self.setDragMode(QGraphicsView.RubberBandDrag)
-        # Fix render hint reference
-        from PySide6.QtGui import QPainter
         self.setRenderHint(QPainter.Antialiasing)
         
         # Grid and visual settings
         self.grid_visible = True
         self.grid_size = 20
         self.setBackgroundBrush(QColor(250, 250, 250))
+        self._build_grid_tile()
+        # Cache drawBackground output so repaints are a single pixmap blit
+        self.setCacheMode(QGraphicsView.CacheBackground)
+        # Repaint the whole viewport instead of computing per-item dirty regions
+        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        # Items set their own pen/brush, so skip per-item painter save/restore
+        # and the 2 px antialias dirty-rect padding
+        self.setOptimizationFlags(QGraphicsView.DontSavePainterState |
+                                  QGraphicsView.DontAdjustForAntialiasing)
         
         # Components
         self.editor = None
         self.parser = None
         self.renderer = None
+
+        # Memoized parse results keyed by stripped expression string
+        self._parse_cache = OrderedDict()
+        self._parse_cache_limit = 128
+
+        # Cached itemsBoundingRect, valid while the renderer generation holds
+        self._bbox_cache = None
+        self._bbox_gen = -1
+
+        # Generation counter for async parses; stale results are discarded
+        self._parse_gen = 0
+
+        # Dedicated single-threaded pool so parses run strictly one at a
+        # time: ClifParser.parse resets shared parser state and mutates
+        # the editor model, so concurrent tasks would race each other
+        # (and the GUI thread, which reads the model while rendering).
+        # The generation counter only discards stale results; this pool
+        # is what serializes execution.
+        self._parse_pool = QThreadPool(self)
+        self._parse_pool.setMaxThreadCount(1)
         
         # Interaction mode
         self.interaction_mode = InteractionMode.CONSTRAINED
@@ -55,6 +148,11 @@ class BullpenCanvas(QGraphicsView):
         self.editor = editor
         self.parser = ClifParser(editor)
         self.renderer = EGRenderer(self.scene, editor)
+        self.renderer.set_batch_mode(True)
+        # Cache each item's rendering at device scale so pans skip paint()
+        self.renderer.default_cache_mode = QGraphicsItem.DeviceCoordinateCache
+        # Rasterize each unique predicate label once and blit it thereafter
+        self.renderer.text_mode = 'pixmap'
         
     def set_interaction_mode(self, mode):
         """Set the interaction mode."""
@@ -65,7 +163,24 @@ class BullpenCanvas(QGraphicsView):
     def set_grid_visible(self, visible):
         """Set grid visibility."""
         self.grid_visible = visible
-        self.update()
+        self.resetCachedContent()
+
+    def set_grid_size(self, size):
+        """Set grid spacing and rebuild the cached grid tile."""
+        self.grid_size = size
+        self._build_grid_tile()
+        self.resetCachedContent()
+
+    def _build_grid_tile(self):
+        """Pre-render one grid cell so drawBackground can tile it in a single blit."""
+        tile = QPixmap(self.grid_size, self.grid_size)
+        tile.fill(QColor(250, 250, 250))
+        painter = QPainter(tile)
+        painter.setPen(QColor(200, 200, 200))
+        painter.drawLine(0, 0, 0, self.grid_size - 1)
+        painter.drawLine(0, 0, self.grid_size - 1, 0)
+        painter.end()
+        self._grid_tile = tile
         
     def render_clif_expression(self, clif_expr):
         """Render a CLIF expression on the canvas."""
@@ -73,26 +188,105 @@ class BullpenCanvas(QGraphicsView):
             return False, "Canvas not properly initialized"
             
         try:
-            # Parse the expression
-            parse_result = self.parser.parse(clif_expr)
-            
-            if not parse_result['success']:
-                return False, f"Parse error: {parse_result.get('error', 'Unknown error')}"
-            
-            # Render the parsed expression
-            render_success = self.renderer.render_from_parse_result(parse_result)
-            
-            if not render_success:
-                return False, "Rendering failed"
-            
-            # Fit view to content
-            self.fitInView(self.scene.itemsBoundingRect(), Qt.KeepAspectRatio)
-            
-            return True, "Successfully rendered"
-            
+            # Parse the expression, reusing a cached result for repeated input
+            key = clif_expr.strip()
+            parse_result = self._parse_cache.get(key)
+            if parse_result is None:
+                # Snapshot so cached results survive later parses
+                parse_result = self.parser.parse(clif_expr, snapshot=True)
+                if parse_result['success']:
+                    self._parse_cache[key] = parse_result
+                    if len(self._parse_cache) > self._parse_cache_limit:
+                        self._parse_cache.popitem(last=False)
+
+            return self._render_parse_result(parse_result)
+
         except Exception as e:
             return False, f"Error: {str(e)}"
-    
+
+    def render_clif_expression_async(self, clif_expr):
+        """Parse on the thread pool, then render on the GUI thread.
+
+        The outcome is reported through the render_finished signal. Rapid
+        successive calls are handled by a generation counter: results from
+        superseded parses are dropped.
+        """
+        if not self.parser or not self.renderer:
+            self.render_finished.emit(False, "Canvas not properly initialized",
+                                      clif_expr)
+            return
+
+        self._parse_gen += 1
+
+        # Cache hits skip the thread pool round-trip entirely
+        parse_result = self._parse_cache.get(clif_expr.strip())
+        if parse_result is not None:
+            self._on_parsed(parse_result, self._parse_gen, clif_expr)
+            return
+
+        task = _ParseTask(self.parser, clif_expr, self._parse_gen)
+        task.signals.finished.connect(self._on_parsed)
+        self._parse_pool.start(task)
+
+    def _on_parsed(self, parse_result, generation, clif_expr):
+        """Render a completed parse on the GUI thread."""
+        if generation != self._parse_gen:
+            return  # A newer request superseded this parse
+
+        if parse_result['success']:
+            key = clif_expr.strip()
+            if key not in self._parse_cache:
+                self._parse_cache[key] = parse_result
+                if len(self._parse_cache) > self._parse_cache_limit:
+                    self._parse_cache.popitem(last=False)
+        else:
+            error = parse_result.get('error', 'Unknown error')
+            self.render_finished.emit(False, f"Parse error: {error}", clif_expr)
+            return
+
+        try:
+            success, message = self._render_parse_result(parse_result)
+        except Exception as e:
+            success, message = False, f"Error: {str(e)}"
+        self.render_finished.emit(success, message, clif_expr)
+
+    def _render_parse_result(self, parse_result):
+        """Render a successful parse result and fit the view to it."""
+        if not parse_result['success']:
+            return False, f"Parse error: {parse_result.get('error', 'Unknown error')}"
+
+        # Render the parsed expression. Bulk adds skip BSP-tree index
+        # maintenance; the index is only rebuilt for large scenes where
+        # linear hit-testing would start to hurt.
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
+        try:
+            render_success = self.renderer.render_from_parse_result(parse_result)
+        finally:
+            if len(self.scene.items()) > 500:
+                self.scene.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+
+        if not render_success:
+            return False, "Rendering failed"
+
+        # Fit view to content
+        self.fitInView(self.items_bounding_rect(), Qt.KeepAspectRatio)
+
+        return True, "Successfully rendered"
+
+
+    def items_bounding_rect(self):
+        """itemsBoundingRect, re-walked only when scene content changed."""
+        if not self.renderer:
+            return self.scene.itemsBoundingRect()
+        if self._bbox_gen != self.renderer.mutation_gen:
+            self._bbox_cache = self.scene.itemsBoundingRect()
+            self._bbox_gen = self.renderer.mutation_gen
+        return self._bbox_cache
+
+    def clear_parse_cache(self):
+        """Drop memoized parse results (call when editor state invalidates them)."""
+        self._parse_cache.clear()
+
     def clear_canvas(self):
         """Clear the canvas."""
         if self.renderer:
@@ -103,30 +297,97 @@ class BullpenCanvas(QGraphicsView):
         super().drawBackground(painter, rect)
         
         if self.grid_visible:
-            # Draw grid
-            painter.setPen(QColor(200, 200, 200))
-            
-            # Vertical lines
-            x = int(rect.left() / self.grid_size) * self.grid_size
-            while x < rect.right():
-                painter.drawLine(x, rect.top(), x, rect.bottom())
-                x += self.grid_size
-            
-            # Horizontal lines
-            y = int(rect.top() / self.grid_size) * self.grid_size
-            while y < rect.bottom():
-                painter.drawLine(rect.left(), y, rect.right(), y)
-                y += self.grid_size
+            # Constrain grid work to the visible portion of the scene so
+            # cost stays independent of total scene extent at far zoom-out
+            vis = self.mapToScene(self.viewport().rect()).boundingRect()
+            rect = vis.intersected(rect)
+            if rect.isEmpty():
+                return
+            if not self._grid_tile.isNull():
+                # Tile the pre-rendered grid cell, aligned to grid
+                # coordinates. The offset names the pixmap point mapped to
+                # the rect's top-left, so it is the (positive) distance
+                # from the nearest grid line at or below the rect edge.
+                ox = int(rect.left()) - (int(rect.left()) % self.grid_size)
+                oy = int(rect.top()) - (int(rect.top()) % self.grid_size)
+                painter.drawTiledPixmap(rect, self._grid_tile,
+                                        QPointF(rect.left() - ox, rect.top() - oy))
+            else:
+                self._draw_grid_lines(painter, rect)
+
+    def _draw_grid_lines(self, painter, rect):
+        """Fallback grid drawing when the cached tile is unavailable.
+
+        Grid coordinates are generated in one vectorized arange (when NumPy
+        is available and the viewport is large) and drawn with a single
+        drawLines call instead of per-line Python iteration.
+        """
+        painter.setPen(QColor(200, 200, 200))
+        x0 = int(rect.left() // self.grid_size) * self.grid_size
+        y0 = int(rect.top() // self.grid_size) * self.grid_size
+
+        line_count = (rect.width() + rect.height()) / self.grid_size
+        if _grid_coords is not None and line_count > 1024:
+            # Huge viewports: endpoints come from JIT-compiled code with no
+            # intermediate Python-object allocation
+            coords = _grid_coords(x0, y0, rect.right(), rect.bottom(),
+                                  self.grid_size)
+            painter.drawLines([QLineF(x1, y1, x2, y2)
+                               for x1, y1, x2, y2 in coords])
+            return
+        if np is not None and line_count > 64:
+            xs = np.arange(x0, int(rect.right()) + 1, self.grid_size)
+            ys = np.arange(y0, int(rect.bottom()) + 1, self.grid_size)
+        else:
+            xs = range(x0, int(rect.right()) + 1, self.grid_size)
+            ys = range(y0, int(rect.bottom()) + 1, self.grid_size)
+
+        lines = [QLineF(x, rect.top(), x, rect.bottom()) for x in xs]
+        lines += [QLineF(rect.left(), y, rect.right(), y) for y in ys]
+        if lines:
+            painter.drawLines(lines)
+
+# Example expressions - all the previously problematic cases.
+# Labels are formatted once at import time and shared across panels.
+EXAMPLES = tuple(
+    (f"{description}: {expr}", expr)
+    for description, expr in [
+        ("Simple predicate with variable", "(Cat x)"),
+        ("Constants relation", "(On cat mat)"),
+        ("Complex existential", "(exists (x y) (and (Cat x) (Mat y) (On x y)))"),
+        ("Corrected equality", "(= x y)"),
+        ("Conjunction with variables", "(and (Cat x) (Dog y))"),
+        ("Negation with variable", "(not (Cat x))"),
+        ("Nested existential with negation", "(exists (x) (and (Cat x) (not (Dog x))))")
+    ]
+)
 
 class ClifInputPanel(QGroupBox):
     """CLIF input panel with all problematic examples."""
-    
+
     expression_requested = Signal(str)
     
     def __init__(self, parent=None):
         super().__init__("CLIF Expression Input", parent)
+
+        # Debounce rapid requests so only the last expression is rendered
+        self._pending_expr = None
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(75)
+        self._debounce.timeout.connect(self._emit_pending_expression)
+
         self.setup_ui()
-        
+
+    def _request_expression(self, expression):
+        """Schedule an expression render, coalescing rapid requests."""
+        self._pending_expr = expression
+        self._debounce.start()
+
+    def _emit_pending_expression(self):
+        if self._pending_expr is not None:
+            self.expression_requested.emit(self._pending_expr)
+
     def setup_ui(self):
         layout = QVBoxLayout(self)
         
@@ -150,19 +411,12 @@ class ClifInputPanel(QGroupBox):
         examples_group = QGroupBox("Test Examples (Previously Problematic)")
         examples_layout = QVBoxLayout(examples_group)
         
-        self.examples = [
-            ("Simple predicate with variable", "(Cat x)"),
-            ("Constants relation", "(On cat mat)"),
-            ("Complex existential", "(exists (x y) (and (Cat x) (Mat y) (On x y)))"),
-            ("Corrected equality", "(= x y)"),
-            ("Conjunction with variables", "(and (Cat x) (Dog y))"),
-            ("Negation with variable", "(not (Cat x))"),
-            ("Nested existential with negation", "(exists (x) (and (Cat x) (not (Dog x))))")
-        ]
-        
-        for description, expr in self.examples:
-            button = QPushButton(f"{description}: {expr}")
-            button.clicked.connect(lambda checked, e=expr: self.load_example(e))
+        self.example_buttons = QButtonGroup(self)
+        for label, expr in EXAMPLES:
+            button = QPushButton(label)
+            button.setProperty("expr", expr)
+            button.clicked.connect(self._on_example_clicked)
+            self.example_buttons.addButton(button)
             examples_layout.addWidget(button)
         
         layout.addWidget(examples_group)
@@ -171,12 +425,16 @@ class ClifInputPanel(QGroupBox):
         """Emit signal to render the current expression."""
         expr = self.input_text.toPlainText().strip()
         if expr:
-            self.expression_requested.emit(expr)
+            self._request_expression(expr)
     
+    def _on_example_clicked(self):
+        """Load the example stored on the clicked button."""
+        self.load_example(self.sender().property("expr"))
+
     def load_example(self, expression):
         """Load an example expression."""
         self.input_text.setPlainText(expression)
-        self.expression_requested.emit(expression)
+        self._request_expression(expression)
     
     clear_requested = Signal()
 
@@ -189,14 +447,7 @@ class InfoPanel(QGroupBox):
         
     def setup_ui(self):
         layout = QVBoxLayout(self)
-        
-        # Scroll area for long content
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        
-        content_widget = QWidget()
-        content_layout = QVBoxLayout(content_widget)
-        
+
         # Information about fixes
         fixes_info = """
 <h3>Critical Issues Fixed:</h3>
@@ -237,13 +488,28 @@ class InfoPanel(QGroupBox):
 • <b>Free:</b> Allows unrestricted positioning for composition
         """
         
-        info_label = QLabel(fixes_info)
-        info_label.setWordWrap(True)
-        info_label.setTextFormat(Qt.RichText)
-        content_layout.addWidget(info_label)
-        
-        scroll.setWidget(content_widget)
-        layout.addWidget(scroll)
+        # QTextBrowser parses the HTML once at setHtml time and scrolls
+        # natively, so resizes reuse the retained document layout
+        info_view = QTextBrowser()
+        info_view.setOpenExternalLinks(False)
+        info_view.setReadOnly(True)
+        info_view.setHtml(fixes_info)
+        layout.addWidget(info_view)
+
+        # Non-modal render error log
+        self.errors_list = QListWidget()
+        self.errors_list.setMaximumHeight(80)
+        self._recent_errors = deque(maxlen=20)
+        layout.addWidget(QLabel("Recent Errors:"))
+        layout.addWidget(self.errors_list)
+
+    def log_error(self, message):
+        """Append a render error without blocking the UI."""
+        self._recent_errors.append(message)
+        self.errors_list.addItem(message)
+        while self.errors_list.count() > len(self._recent_errors):
+            self.errors_list.takeItem(0)
+        self.errors_list.scrollToBottom()
 
 class BullpenMainWindow(QMainWindow):
     """Main window with all fixes integrated."""
@@ -260,11 +526,13 @@ class BullpenMainWindow(QMainWindow):
         self.setup_ui()
         self.setup_connections()
         
-        # Status update timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_status)
-        self.update_timer.start(1000)
-        
+        # Last item counts shown in the status bar
+        self._last_item_counts = None
+
+        # Consecutive identical render errors (for modal escalation)
+        self._last_error = None
+        self._same_error_count = 0
+
     def setup_ui(self):
         """Setup the main UI layout."""
         central_widget = QWidget()
@@ -301,8 +569,13 @@ class BullpenMainWindow(QMainWindow):
         self.canvas.set_editor(self.editor)
         right_layout.addWidget(self.canvas)
         
-        # Status bar
+        # Status bar. The stylesheet is parsed once here; later updates just
+        # flip the 'state' property instead of re-parsing CSS per message.
         self.status_label = QLabel("Ready - All critical issues have been fixed")
+        self.status_label.setStyleSheet(
+            "QLabel[state='ok']{color:green;} QLabel[state='err']{color:red;} "
+            "QLabel[state='info']{color:blue;} QLabel[state='warn']{color:orange;}"
+        )
         right_layout.addWidget(self.status_label)
         
         # Add panels to splitter
@@ -367,30 +640,52 @@ class BullpenMainWindow(QMainWindow):
         # CLIF panel connections
         self.clif_panel.expression_requested.connect(self.render_expression)
         self.clif_panel.clear_requested.connect(self.clear_canvas)
+        self.canvas.render_finished.connect(self._on_render_finished)
         
         # Control panel connections
         self.mode_group.buttonClicked.connect(self.mode_changed)
         self.grid_checkbox.toggled.connect(self.canvas.set_grid_visible)
         
+    def _set_status_state(self, state):
+        """Recolor the status label via its 'state' property."""
+        self.status_label.setProperty("state", state)
+        style = self.status_label.style()
+        style.unpolish(self.status_label)
+        style.polish(self.status_label)
+
     def render_expression(self, expression):
-        """Render a CLIF expression."""
-        success, message = self.canvas.render_clif_expression(expression)
-        
+        """Render a CLIF expression (parse runs off the GUI thread)."""
+        self.canvas.render_clif_expression_async(expression)
+
+    def _on_render_finished(self, success, message, expression):
+        """Show the outcome of an asynchronous render."""
         if success:
             self.status_label.setText(f"✓ {message}: {expression}")
-            self.status_label.setStyleSheet("color: green;")
+            self._set_status_state("ok")
+            self.update_status()
         else:
             self.status_label.setText(f"✗ {message}: {expression}")
-            self.status_label.setStyleSheet("color: red;")
-            
-            # Show detailed error
-            QMessageBox.warning(self, "Rendering Error", f"Failed to render: {expression}\n\nError: {message}")
+            self._set_status_state("err")
+
+            # Log non-modally; only escalate to a dialog if the same
+            # error keeps recurring, so bad input never blocks the UI
+            error_text = f"Failed to render: {expression}\n\nError: {message}"
+            if error_text == self._last_error:
+                self._same_error_count += 1
+            else:
+                self._last_error = error_text
+                self._same_error_count = 1
+            self.info_panel.log_error(f"{expression}: {message}")
+            if self._same_error_count > 3:
+                QMessageBox.warning(self, "Rendering Error", error_text)
+                self._same_error_count = 0
     
     def clear_canvas(self):
         """Clear the canvas."""
         self.canvas.clear_canvas()
         self.status_label.setText("Canvas cleared")
-        self.status_label.setStyleSheet("color: blue;")
+        self._set_status_state("info")
+        self._last_item_counts = None
         
     def mode_changed(self, button):
         """Handle interaction mode change."""
@@ -402,38 +697,44 @@ class BullpenMainWindow(QMainWindow):
             self.status_label.setText("Mode: Free (unrestricted positioning)")
             
         self.canvas.set_interaction_mode(mode)
-        self.status_label.setStyleSheet("color: blue;")
+        self._set_status_state("info")
         
     def zoom_in(self):
         """Zoom in on the canvas."""
         self.canvas.scale(1.2, 1.2)
         self.status_label.setText("Zoomed in")
-        self.status_label.setStyleSheet("color: blue;")
+        self._set_status_state("info")
         
     def zoom_out(self):
         """Zoom out on the canvas."""
         self.canvas.scale(0.8, 0.8)
         self.status_label.setText("Zoomed out")
-        self.status_label.setStyleSheet("color: blue;")
+        self._set_status_state("info")
         
     def zoom_fit(self):
         """Fit the canvas content to view."""
         if self.canvas.scene.items():
-            self.canvas.fitInView(self.canvas.scene.itemsBoundingRect(), Qt.KeepAspectRatio)
+            self.canvas.fitInView(self.canvas.items_bounding_rect(), Qt.KeepAspectRatio)
             self.status_label.setText("Fitted to view")
-            self.status_label.setStyleSheet("color: blue;")
+            self._set_status_state("info")
         else:
             self.status_label.setText("No content to fit")
-            self.status_label.setStyleSheet("color: orange;")
+            self._set_status_state("warn")
         
     def update_status(self):
-        """Update status information."""
+        """Update status information after a render or clear."""
         # Count rendered items
         if self.canvas.renderer:
-            graphics_count = len(self.canvas.renderer.graphics_items)
-            lines_count = len(self.canvas.renderer.line_items)
-            ligatures_count = len(self.canvas.renderer.ligature_items)
-            
+            counts = (len(self.canvas.renderer.graphics_items),
+                      len(self.canvas.renderer.line_items),
+                      len(self.canvas.renderer.ligature_items))
+
+            # Skip the label repaint when nothing changed
+            if counts == self._last_item_counts:
+                return
+            self._last_item_counts = counts
+
+            graphics_count, lines_count, ligatures_count = counts
             if graphics_count > 0 or lines_count > 0 or ligatures_count > 0:
                 details = f"Items: {graphics_count} graphics, {lines_count} lines, {ligatures_count} ligatures"
                 current_text = self.status_label.text()
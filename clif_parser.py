@@ -3,11 +3,260 @@ CLIF Parser for Existential Graphs
 Addresses all remaining issues with constant handling and ligature connections.
 """
 
-import re
+import sys
 import uuid
+from types import MappingProxyType
 from typing import List, Dict, Any, Set, Tuple
 from eg_editor import EGEditor
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Shared empty-argument tuple for arity-0 predicates
+_EMPTY_ARGS = ()
+
+# Characters that terminate an atom token
+_DELIMS = frozenset(' \t\n\r();')
+_WHITESPACE = frozenset(' \t\n\r')
+
+# Byte-code equivalents for the ASCII fast path (iterating bytes yields ints)
+_ASCII_DELIMS = frozenset(b' \t\n\r();')
+
+if njit is not None:
+    import numpy as _np
+
+    @njit(cache=True)
+    def _scan_spans(buf, starts, ends):
+        """Scan a uint8 buffer, writing token spans into starts/ends.
+
+        Returns (token_count, final_paren_depth); a negative depth means
+        an unmatched closing parenthesis was seen.
+        """
+        n = buf.shape[0]
+        count = 0
+        depth = 0
+        i = 0
+        while i < n:
+            c = buf[i]
+            if c == 59:  # ';' - comment to end of line
+                while i < n and buf[i] != 10:
+                    i += 1
+            elif c == 32 or c == 9 or c == 10 or c == 13:
+                i += 1
+            elif c == 40:  # '('
+                starts[count] = i
+                ends[count] = i + 1
+                count += 1
+                depth += 1
+                i += 1
+            elif c == 41:  # ')'
+                depth -= 1
+                if depth < 0:
+                    return count, -1
+                starts[count] = i
+                ends[count] = i + 1
+                count += 1
+                i += 1
+            else:
+                atom_start = i
+                while i < n:
+                    c = buf[i]
+                    if (c == 32 or c == 9 or c == 10 or c == 13
+                            or c == 40 or c == 41 or c == 59):
+                        break
+                    i += 1
+                starts[count] = atom_start
+                ends[count] = i
+                count += 1
+        return count, depth
+else:
+    _scan_spans = None
+
+class ClifParserError(Exception):
+    """Raised when a CLIF expression cannot be parsed."""
+    pass
+
+
+class Node:
+    """Flat AST record; one per parsed expression element.
+
+    Nodes live in the parser's nodes list and reference their children by
+    index into that list, so a parse allocates one slotted record per
+    element instead of a tree of small dicts. Legacy key access
+    (node['type'], node.get('type')) is kept for shallow consumers.
+    """
+    __slots__ = ('kind', 'name', 'pred_id', 'cut_id', 'line_id',
+                 'hook_index', 'arity', 'variables', 'children')
+
+    _KEY_ALIASES = {'type': 'kind', 'predicate_id': 'pred_id'}
+
+    def __init__(self, kind, name=None, pred_id=None, cut_id=None,
+                 line_id=None, hook_index=0, arity=0, variables=None,
+                 children=None):
+        self.kind = kind
+        self.name = name
+        self.pred_id = pred_id
+        self.cut_id = cut_id
+        self.line_id = line_id
+        self.hook_index = hook_index
+        self.arity = arity
+        self.variables = variables
+        self.children = children
+
+    def __getitem__(self, key):
+        return getattr(self, self._KEY_ALIASES.get(key, key))
+
+    def __contains__(self, key):
+        return hasattr(self, self._KEY_ALIASES.get(key, key))
+
+    def get(self, key, default=None):
+        return getattr(self, self._KEY_ALIASES.get(key, key), default)
+
+    def __repr__(self):
+        return f"Node({self.kind!r}, name={self.name!r})"
+
+
+# Op tags for recorded editor mutations (see ClifParser.compile)
+_OP_ADD_PRED = 0
+_OP_ADD_PREDS = 1
+_OP_ADD_CUT = 2
+_OP_ADD_LIG = 3
+_OP_BIND_HOOK = 4
+
+
+class _LigatureStub:
+    """Stands in for a Ligature during recording parses."""
+    __slots__ = ('line_of_identity_id',)
+
+    def __init__(self, line_id):
+        self.line_of_identity_id = line_id
+
+
+class _RecordingModel:
+    """Just enough model surface for the parser's ligature lookups."""
+
+    def __init__(self):
+        self.objects = {}
+
+    def get_object(self, obj_id):
+        return self.objects.get(obj_id)
+
+
+class _RecordingEditor:
+    """Editor stand-in that records mutations instead of applying them.
+
+    Hands out placeholder ids ('$1', '$2', ...) and appends one op tuple
+    per mutation; BuiltExpr.apply() later replays the ops against a real
+    editor and remaps the placeholders.
+    """
+
+    def __init__(self):
+        self.ops = []
+        self.model = _RecordingModel()
+        self._counter = 0
+
+    def _new_id(self):
+        self._counter += 1
+        return '$%d' % self._counter
+
+    def add_predicate(self, label, hooks, parent_id='SA', p_type='relation', is_functional=False):
+        placeholder = self._new_id()
+        self.ops.append((_OP_ADD_PRED, placeholder, label, hooks, parent_id))
+        return placeholder
+
+    def add_predicates(self, specs):
+        placeholders = tuple(self._new_id() for _ in specs)
+        self.ops.append((_OP_ADD_PREDS, placeholders, tuple(specs)))
+        return list(placeholders)
+
+    def add_cut(self, parent_id='SA'):
+        placeholder = self._new_id()
+        self.ops.append((_OP_ADD_CUT, placeholder, parent_id))
+        return placeholder
+
+    def add_ligature(self, parent_id='SA'):
+        ligature_id = self._new_id()
+        line_id = self._new_id()
+        self.model.objects[ligature_id] = _LigatureStub(line_id)
+        self.ops.append((_OP_ADD_LIG, ligature_id, line_id))
+        return ligature_id
+
+    def _bind_hook(self, pred_id, hook_index, line_id):
+        self.ops.append((_OP_BIND_HOOK, pred_id, hook_index, line_id))
+
+
+class BuiltExpr:
+    """A compiled CLIF expression: parse once, replay many times.
+
+    Produced by ClifParser.compile(). apply(editor) replays the recorded
+    editor mutations without re-tokenizing or re-parsing, so the same
+    expression structure can be instantiated cheaply against many editor
+    instances (test fixtures, UI previews).
+    """
+    __slots__ = ('source', 'ops', '_parsed')
+
+    def __init__(self, source, ops, parsed):
+        self.source = source
+        self.ops = ops
+        self._parsed = parsed
+
+    def apply(self, editor) -> Dict[str, Any]:
+        """Replay the recorded mutations; returns a parse()-shaped dict."""
+        id_map = {'SA': 'SA'}
+        for op in self.ops:
+            tag = op[0]
+            if tag == _OP_ADD_PRED:
+                _, placeholder, label, hooks, parent = op
+                id_map[placeholder] = editor.add_predicate(label, hooks, id_map[parent])
+            elif tag == _OP_ADD_PREDS:
+                _, placeholders, specs = op
+                real_ids = editor.add_predicates(
+                    [(label, hooks, id_map[parent]) for label, hooks, parent in specs])
+                for placeholder, real_id in zip(placeholders, real_ids):
+                    id_map[placeholder] = real_id
+            elif tag == _OP_ADD_CUT:
+                _, placeholder, parent = op
+                id_map[placeholder] = editor.add_cut(id_map[parent])
+            elif tag == _OP_ADD_LIG:
+                _, lig_placeholder, line_placeholder = op
+                ligature_id = editor.add_ligature()
+                id_map[lig_placeholder] = ligature_id
+                ligature = editor.model.get_object(ligature_id)
+                id_map[line_placeholder] = ligature.line_of_identity_id
+            else:  # _OP_BIND_HOOK
+                _, pred, hook_index, line = op
+                editor._bind_hook(id_map.get(pred, pred), hook_index,
+                                  id_map.get(line, line))
+
+        parsed = self._parsed
+        remap = id_map.get
+        nodes = [
+            Node(node.kind, name=node.name,
+                 pred_id=remap(node.pred_id, node.pred_id),
+                 cut_id=remap(node.cut_id, node.cut_id),
+                 line_id=remap(node.line_id, node.line_id),
+                 hook_index=node.hook_index, arity=node.arity,
+                 variables=node.variables, children=node.children)
+            for node in parsed['nodes']]
+        return {
+            'success': True,
+            'nodes': nodes,
+            'root': parsed['root'],
+            'result': nodes[parsed['root']],
+            'variable_map': {
+                var: id_map.get(line, line)
+                for var, line in parsed['variable_map'].items()},
+            'constant_predicates': {
+                const: id_map.get(pred, pred)
+                for const, pred in parsed['constant_predicates'].items()},
+            'hook_connections': {
+                (id_map.get(pred, pred), hook): id_map.get(line, line)
+                for (pred, hook), line in parsed['hook_connections'].items()},
+        }
+
+
 class ClifParser:
     """
     CLIF parser that properly handles:
@@ -22,33 +271,125 @@ class ClifParser:
         self.variable_map = {}  # Maps variables to line IDs
         self.constant_predicates = {}  # Maps constants to their predicate IDs
         self.hook_connections = {}  # Maps (predicate_id, hook_index) to line_id
+        # Hook connections are recorded into parallel arrays (SoA) during
+        # the parse; the dict above is materialized once at the end
+        self._hc_pred = []
+        self._hc_hook = []
+        self._hc_line = []
+        self._tokens = []  # Token stream for the current parse
+        self._pos = 0      # Cursor into self._tokens
+        self._end = 0      # Token count, hoisted once per parse
+        self._nodes = []   # Flat AST; children reference indices into this list
+        self._is_const_cache = {}  # Memoized constant/variable classifications
+        self._cap_cache = {}  # Memoized capitalized constant labels
         self.reset()
-    
+
     def reset(self):
         """Reset parser state for new expression."""
         self.variable_map.clear()
         self.constant_predicates.clear()
         self.hook_connections.clear()
-    
-    def parse(self, clif_string: str) -> Dict[str, Any]:
-        """Parse a CLIF expression and return result with success status."""
+        self._hc_pred.clear()
+        self._hc_hook.clear()
+        self._hc_line.clear()
+        self._tokens = []
+        self._pos = 0
+        self._end = 0
+        self._nodes = []
+        self._is_const_cache.clear()
+        self._cap_cache.clear()
+
+    @classmethod
+    def compile(cls, clif_string: str) -> BuiltExpr:
+        """Parse a CLIF expression once into a replayable BuiltExpr.
+
+        The tokenize and parse phases run against a recording editor;
+        the returned BuiltExpr.apply(editor) just replays the recorded
+        mutations. Callers can cache BuiltExpr instances keyed by the
+        source string.
+        """
+        recorder = _RecordingEditor()
+        parsed = cls(recorder).parse(clif_string, snapshot=True)
+        if not parsed['success']:
+            raise ClifParserError(parsed['error'])
+        return BuiltExpr(clif_string, recorder.ops, parsed)
+
+    def _capitalized(self, token: str) -> str:
+        """Return the interned capitalized label for a constant token."""
+        label = self._cap_cache.get(token)
+        if label is None:
+            label = self._cap_cache.setdefault(token, sys.intern(token.capitalize()))
+        return label
+
+    def _add_node(self, node: Node) -> int:
+        """Append a node to the flat AST and return its index."""
+        self._nodes.append(node)
+        return len(self._nodes) - 1
+
+    def _record_hook(self, pred_id: str, hook_index: int, line_id: str):
+        """Record a hook connection and bind it in the model.
+
+        The line id is already known here, so binding goes through the
+        editor's _bind_hook fast path rather than the full connect()
+        machinery (line discovery, merge scan, per-call ligature).
+        """
+        self._hc_pred.append(pred_id)
+        self._hc_hook.append(hook_index)
+        self._hc_line.append(line_id)
+        self.editor._bind_hook(pred_id, hook_index, line_id)
+
+    def iter_hook_connections(self):
+        """Yield ((pred_id, hook_index), line_id) without building a dict."""
+        return zip(zip(self._hc_pred, self._hc_hook), self._hc_line)
+
+    def parse(self, clif_string: str, snapshot: bool = False) -> Dict[str, Any]:
+        """Parse a CLIF expression and return result with success status.
+
+        The AST comes back as a flat node list ('nodes') plus the root
+        index ('root'); 'result' is the root Node for shallow consumers.
+        By default the returned maps are read-only views of the parser's
+        live state and become invalid on the next parse()/reset(); pass
+        snapshot=True for independent copies that outlive the parser.
+        """
         try:
             self.reset()
-            
+
             # Tokenize
-            tokens = self._tokenize(clif_string)
-            
+            self._tokens = self._tokenize(clif_string)
+            self._pos = 0
+            self._end = len(self._tokens)
+
             # Parse expression
-            result = self._parse_expression(tokens, 'SA')
-            
+            root = self._parse_expression('SA')
+
+            if self._pos != self._end:
+                raise ClifParserError(
+                    f"Unexpected trailing tokens: {' '.join(self._tokens[self._pos:])}")
+
+            # Materialize the hook-connection dict once from the SoA arrays
+            self.hook_connections.update(self.iter_hook_connections())
+
+            if snapshot:
+                return {
+                    'success': True,
+                    'nodes': list(self._nodes),
+                    'root': root,
+                    'result': self._nodes[root],
+                    'variable_map': self.variable_map.copy(),
+                    'constant_predicates': self.constant_predicates.copy(),
+                    'hook_connections': self.hook_connections.copy()
+                }
+
             return {
                 'success': True,
-                'result': result,
-                'variable_map': self.variable_map.copy(),
-                'constant_predicates': self.constant_predicates.copy(),
-                'hook_connections': self.hook_connections.copy()
+                'nodes': self._nodes,
+                'root': root,
+                'result': self._nodes[root],
+                'variable_map': MappingProxyType(self.variable_map),
+                'constant_predicates': MappingProxyType(self.constant_predicates),
+                'hook_connections': MappingProxyType(self.hook_connections)
             }
-            
+
         except Exception as e:
             return {
                 'success': False,
@@ -59,137 +400,282 @@ class ClifParser:
             }
     
     def _tokenize(self, clif_string: str) -> List[str]:
-        """Tokenize a CLIF string into a list of tokens."""
-        # Remove comments and normalize whitespace
-        clif_string = re.sub(r';.*$', '', clif_string, flags=re.MULTILINE)
-        clif_string = re.sub(r'\s+', ' ', clif_string).strip()
-        
-        if not clif_string:
-            raise Exception("Empty expression")
-        
-        # Tokenize using regex
-        token_pattern = r'\(|\)|[^\s()]+'
-        tokens = re.findall(token_pattern, clif_string)
-        
+        """Tokenize a CLIF string in a single indexed scan.
+
+        Comments are skipped, '(' / ')' and atom tokens are emitted
+        directly, and parenthesis balance is validated in the same pass -
+        no intermediate strings or extra validation passes.
+        """
+        if clif_string.isascii():
+            if _scan_spans is not None:
+                return self._tokenize_ascii(clif_string)
+            return self._tokenize_ascii_py(clif_string)
+
+        s = clif_string
+        n = len(s)
+        tokens = []
+        depth = 0
+        i = 0
+        while i < n:
+            ch = s[i]
+            if ch == ';':
+                # Comment runs to end of line
+                newline = s.find('\n', i)
+                i = n if newline == -1 else newline + 1
+            elif ch in _WHITESPACE:
+                i += 1
+            elif ch == '(':
+                tokens.append('(')
+                depth += 1
+                i += 1
+            elif ch == ')':
+                depth -= 1
+                if depth < 0:
+                    raise ClifParserError("Unmatched closing parenthesis")
+                tokens.append(')')
+                i += 1
+            else:
+                start = i
+                while i < n and s[i] not in _DELIMS:
+                    i += 1
+                tokens.append(s[start:i])
+
+        if depth != 0:
+            raise ClifParserError("Unmatched opening parenthesis")
+
         if not tokens:
-            raise Exception("No valid tokens found")
-            
-        # Validate parentheses balance
-        paren_count = 0
-        for token in tokens:
-            if token == '(':
-                paren_count += 1
-            elif token == ')':
-                paren_count -= 1
-                if paren_count < 0:
-                    raise Exception("Unmatched closing parenthesis")
-        
-        if paren_count != 0:
-            raise Exception("Unmatched opening parenthesis")
-            
+            raise ClifParserError("Empty expression")
+
         return tokens
-    
-    def _parse_expression(self, tokens: List[str], parent_context: str) -> Dict[str, Any]:
-        """Parse a single CLIF expression."""
+
+    def _tokenize_ascii_py(self, clif_string: str) -> List[str]:
+        """Tokenize ASCII input by scanning its bytes.
+
+        Byte comparisons are plain int compares, avoiding the per-character
+        Unicode machinery of the str scanner; tokens are sliced out of the
+        original string (indices align one-to-one for ASCII).
+        """
+        s = clif_string
+        buf = s.encode('ascii')
+        n = len(buf)
+        tokens = []
+        depth = 0
+        i = 0
+        while i < n:
+            c = buf[i]
+            if c == 59:  # ';' - comment to end of line
+                newline = buf.find(b'\n', i)
+                i = n if newline == -1 else newline + 1
+            elif c == 32 or c == 9 or c == 10 or c == 13:
+                i += 1
+            elif c == 40:  # '('
+                tokens.append('(')
+                depth += 1
+                i += 1
+            elif c == 41:  # ')'
+                depth -= 1
+                if depth < 0:
+                    raise ClifParserError("Unmatched closing parenthesis")
+                tokens.append(')')
+                i += 1
+            else:
+                start = i
+                while i < n and buf[i] not in _ASCII_DELIMS:
+                    i += 1
+                tokens.append(s[start:i])
+
+        if depth != 0:
+            raise ClifParserError("Unmatched opening parenthesis")
+
         if not tokens:
-            raise Exception("Empty expression")
-        
-        # Single token - constant
-        if len(tokens) == 1:
-            return self._parse_single_constant(tokens[0], parent_context)
-        
-        # Parenthesized expression
-        if tokens[0] == '(' and tokens[-1] == ')':
-            inner_tokens = tokens[1:-1]
-            
-            if not inner_tokens:
-                raise Exception("Empty parentheses")
-            
-            operator = inner_tokens[0]
-            
-            if operator == 'exists':
-                return self._parse_exists(tokens, parent_context)
-            elif operator == 'and':
-                return self._parse_and(tokens, parent_context)
-            elif operator == 'not':
-                return self._parse_not(tokens, parent_context)
-            elif operator == '=':
-                return self._parse_equality(tokens, parent_context)
+            raise ClifParserError("Empty expression")
+
+        return tokens
+
+    def _tokenize_ascii(self, clif_string: str) -> List[str]:
+        """Tokenize ASCII input with the JIT-compiled byte scanner."""
+        buf = _np.frombuffer(clif_string.encode('ascii'), dtype=_np.uint8)
+        # Every byte can emit at most one token
+        starts = _np.empty(max(len(buf), 1), dtype=_np.int32)
+        ends = _np.empty_like(starts)
+        count, depth = _scan_spans(buf, starts, ends)
+
+        if depth < 0:
+            raise ClifParserError("Unmatched closing parenthesis")
+        if depth != 0:
+            raise ClifParserError("Unmatched opening parenthesis")
+        if count == 0:
+            raise ClifParserError("Empty expression")
+
+        return [clif_string[starts[k]:ends[k]] for k in range(count)]
+
+    # State tags for the explicit parse stack
+    _ST_AND = 0
+    _ST_NOT = 1
+    _ST_EXISTS = 2
+
+    def _parse_expression(self, parent_context: str) -> int:
+        """Parse the expression at the cursor with an explicit work stack.
+
+        Compound operators (and/not/exists) push a frame and loop instead
+        of recursing, so deeply nested expressions cost no Python call
+        frames. Leaf forms (predicates, equality, bare constants) are
+        parsed directly by their handlers. Returns the root node's index
+        into self._nodes.
+        """
+        tokens = self._tokens
+        stack = []  # Frames: [state_tag, enclosing_context, accumulator]
+        ctx = parent_context
+        while True:
+            # Descend: parse the head of the expression at the cursor
+            if self._pos >= self._end:
+                raise ClifParserError("Empty expression")
+            token = tokens[self._pos]
+            if token != '(':
+                if token == ')':
+                    raise ClifParserError("Unexpected closing parenthesis")
+                self._pos += 1
+                result = self._parse_single_constant(token, ctx)
             else:
-                # Predicate with arguments
-                return self._parse_predicate(tokens, parent_context)
-        
-        raise Exception(f"Invalid expression: {' '.join(tokens)}")
+                self._pos += 1
+                operator = tokens[self._pos]
+                if operator == ')':
+                    raise ClifParserError("Empty parentheses")
+                state = self._COMPOUND.get(operator)
+                if state is not None:
+                    self._pos += 1
+                    if state == self._ST_AND:
+                        if tokens[self._pos] == ')':
+                            raise ClifParserError("No valid conjuncts found in 'and' expression")
+                        stack.append([state, ctx, []])
+                    elif state == self._ST_NOT:
+                        if tokens[self._pos] == ')':
+                            raise ClifParserError("Malformed 'not' expression")
+                        cut_id = self.editor.add_cut(ctx)
+                        stack.append([state, ctx, cut_id])
+                        ctx = cut_id
+                    else:  # _ST_EXISTS
+                        stack.append([state, ctx, self._parse_exists_head()])
+                    continue
+                # One hash lookup instead of chained string comparisons;
+                # unknown operators fall through to the predicate handler
+                handler = self._DISPATCH.get(operator, ClifParser._parse_predicate)
+                result = handler(self, ctx)
+
+            # Reduce: deliver the result to the enclosing frames
+            while stack:
+                frame = stack[-1]
+                state = frame[0]
+                if state == self._ST_AND:
+                    frame[2].append(result)
+                    if tokens[self._pos] != ')':
+                        ctx = frame[1]
+                        break  # Descend into the next conjunct
+                    self._pos += 1
+                    stack.pop()
+                    result = self._add_node(Node('and', children=frame[2]))
+                elif state == self._ST_NOT:
+                    self._expect_close('not')
+                    stack.pop()
+                    ctx = frame[1]
+                    result = self._add_node(
+                        Node('not', cut_id=frame[2], children=[result]))
+                else:  # _ST_EXISTS
+                    self._expect_close('exists')
+                    stack.pop()
+                    ctx = frame[1]
+                    result = self._add_node(
+                        Node('exists', variables=frame[2], children=[result]))
+            else:
+                return result
+
+    def _expect_close(self, what: str):
+        """Consume the closing parenthesis ending the current expression."""
+        if self._pos >= self._end or self._tokens[self._pos] != ')':
+            raise ClifParserError(f"Malformed '{what}' expression")
+        self._pos += 1
     
-    def _parse_single_constant(self, token: str, parent_context: str) -> Dict[str, Any]:
+    def _parse_single_constant(self, token: str, parent_context: str) -> int:
         """Parse a single constant token."""
         # Create predicate for constant (arity 0)
-        pred_id = self.editor.add_predicate(token.capitalize(), 0, parent_context)
+        pred_id = self.editor.add_predicate(self._capitalized(token), 0, parent_context)
         self.constant_predicates[token] = pred_id
-        
-        return {
-            'type': 'constant',
-            'name': token,
-            'predicate_id': pred_id
-        }
+
+        return self._add_node(Node('constant', name=token, pred_id=pred_id))
     
-    def _parse_predicate(self, tokens: List[str], parent_context: str) -> Dict[str, Any]:
+    def _parse_predicate(self, parent_context: str) -> int:
         """Parse a predicate with arguments like '(Cat x)' or '(On x y)'."""
-        inner_tokens = tokens[1:-1]
-        predicate_name = inner_tokens[0]
-        arguments = inner_tokens[1:]
-        
-        # Create main predicate
+        tokens = self._tokens
+        predicate_name = tokens[self._pos]
+        self._pos += 1
+
+        arguments = []
+        while tokens[self._pos] != ')':
+            if tokens[self._pos] == '(':
+                raise ClifParserError(f"Malformed '{predicate_name}' expression")
+            arguments.append(tokens[self._pos])
+            self._pos += 1
+        self._pos += 1
+
+        # Arity-0 predicates (propositional facts) skip the argument
+        # machinery entirely and share one empty-arguments tuple
         arity = len(arguments)
-        pred_id = self.editor.add_predicate(predicate_name, arity, parent_context)
-        
+        if arity == 0:
+            pred_id = self.editor.add_predicate(predicate_name, 0, parent_context)
+            return self._add_node(
+                Node('predicate', name=predicate_name, pred_id=pred_id,
+                     children=_EMPTY_ARGS))
+
+        # Batch the main predicate with any not-yet-seen constant-argument
+        # predicates so the editor resolves the parent context once
+        specs = [(predicate_name, arity, parent_context)]
+        new_constants = []
+        for arg in arguments:
+            if (self._is_constant(arg) and arg not in self.constant_predicates
+                    and arg not in new_constants):
+                new_constants.append(arg)
+                specs.append((self._capitalized(arg), 1, parent_context))
+        ids = self.editor.add_predicates(specs)
+        pred_id = ids[0]
+        for arg, const_id in zip(new_constants, ids[1:]):
+            self.constant_predicates[arg] = const_id
+
         # Process each argument and create proper connections
-        argument_info = []
-        
+        argument_nodes = []
+
         for i, arg in enumerate(arguments):
             hook_index = i + 1
-            
+
             if self._is_constant(arg):
                 # Create constant predicate
                 const_pred_id = self._create_constant_predicate(arg, parent_context)
-                
+
                 # Create line of identity for the connection
                 line_id = self._create_line_of_identity()
-                
+
                 # Connect constant predicate to line (constants have hook 1)
-                self.hook_connections[(const_pred_id, 1)] = line_id
-                
+                self._record_hook(const_pred_id, 1, line_id)
+
                 # Connect main predicate's hook to the same line
-                self.hook_connections[(pred_id, hook_index)] = line_id
-                
-                argument_info.append({
-                    'type': 'constant',
-                    'name': arg,
-                    'predicate_id': const_pred_id,
-                    'line_id': line_id,
-                    'hook_index': hook_index
-                })
+                self._record_hook(pred_id, hook_index, line_id)
+
+                argument_nodes.append(self._add_node(
+                    Node('constant', name=arg, pred_id=const_pred_id,
+                         line_id=line_id, hook_index=hook_index)))
             else:
                 # Variable - get or create line of identity
                 line_id = self._get_or_create_line_for_variable(arg)
-                
+
                 # Connect main predicate's hook to the line
-                self.hook_connections[(pred_id, hook_index)] = line_id
-                
-                argument_info.append({
-                    'type': 'variable',
-                    'name': arg,
-                    'line_id': line_id,
-                    'hook_index': hook_index
-                })
-        
-        return {
-            'type': 'predicate',
-            'predicate_id': pred_id,
-            'name': predicate_name,
-            'arguments': argument_info,
-            'arity': arity
-        }
+                self._record_hook(pred_id, hook_index, line_id)
+
+                argument_nodes.append(self._add_node(
+                    Node('variable', name=arg, line_id=line_id,
+                         hook_index=hook_index)))
+
+        return self._add_node(
+            Node('predicate', name=predicate_name, pred_id=pred_id,
+                 arity=arity, children=argument_nodes))
     
     def _create_constant_predicate(self, constant: str, parent_context: str) -> str:
         """Create a predicate for a constant."""
@@ -197,122 +683,86 @@ class ClifParser:
             return self.constant_predicates[constant]
         
         # Create new predicate for this constant (arity 1 for connection)
-        pred_id = self.editor.add_predicate(constant.capitalize(), 1, parent_context)
+        pred_id = self.editor.add_predicate(self._capitalized(constant), 1, parent_context)
         self.constant_predicates[constant] = pred_id
         return pred_id
     
     def _is_constant(self, token: str) -> bool:
-        """Determine if a token represents a constant."""
-        # Simple heuristic: constants are lowercase or start with lowercase
-        if len(token) == 1 and token.isupper():
-            return False  # Single uppercase letter is likely a variable
-        if token.islower() or (token[0].islower() and len(token) > 1):
-            return True
-        return False
+        """Determine if a token represents a constant (memoized per parse)."""
+        cached = self._is_const_cache.get(token)
+        if cached is None:
+            cached = self._is_const_cache.setdefault(token, self._classify(token))
+        return cached
+
+    @staticmethod
+    def _classify(token: str) -> bool:
+        """Classify a token: constants start with a lowercase letter."""
+        # Single-token case also covers lone uppercase letters (variables)
+        return token[0].islower() if len(token) > 1 else token.islower()
     
-    def _parse_equality(self, tokens: List[str], parent_context: str) -> Dict[str, Any]:
+    def _parse_equality(self, parent_context: str) -> int:
         """Parse equality with corrected merged line representation."""
-        if len(tokens) != 5:  # (= x y)
-            raise Exception("Equality requires exactly two arguments")
-        
-        var1 = tokens[2]
-        var2 = tokens[3]
-        
+        tokens = self._tokens
+        self._pos += 1  # consume '='
+
+        args = []
+        while self._pos < self._end and tokens[self._pos] not in ('(', ')'):
+            args.append(tokens[self._pos])
+            self._pos += 1
+
+        if len(args) != 2 or self._pos >= self._end or tokens[self._pos] != ')':
+            raise ClifParserError("Equality requires exactly two arguments")
+        self._pos += 1
+
+        var1, var2 = args
+
         # Create or get line for first variable
         line_id = self._get_or_create_line_for_variable(var1)
         
         # Map second variable to the SAME line of identity
         self.variable_map[var2] = line_id
-        
-        return {
-            'type': 'equality',
-            'variable1': var1,
-            'variable2': var2,
-            'shared_line_id': line_id,
-            'representation': 'merged_lines'
-        }
+
+        return self._add_node(
+            Node('equality', variables=(var1, var2), line_id=line_id))
     
-    def _parse_exists(self, tokens: List[str], parent_context: str) -> Dict[str, Any]:
-        """Parse existential quantification."""
-        if len(tokens) < 5:
-            raise Exception("Malformed 'exists' expression")
-        
-        # Extract variable list
-        var_end = self._find_matching_paren_from_start(tokens, 2)
-        variables = tokens[3:var_end]
-        
-        # Extract body
-        body_tokens = tokens[var_end + 1:-1]
-        
+    def _parse_exists_head(self) -> List[str]:
+        """Consume an 'exists' variable list and bind lines of identity.
+
+        Leaves the cursor at the start of the quantified body; the body
+        itself is parsed by the caller's work stack.
+        """
+        tokens = self._tokens
+
+        if self._pos >= self._end or tokens[self._pos] != '(':
+            raise ClifParserError("Malformed 'exists' expression")
+        self._pos += 1
+
+        variables = []
+        while tokens[self._pos] != ')':
+            if tokens[self._pos] == '(':
+                raise ClifParserError("Malformed 'exists' expression")
+            variables.append(tokens[self._pos])
+            self._pos += 1
+        self._pos += 1
+
         # Create lines of identity for all quantified variables
         for var in variables:
             self._get_or_create_line_for_variable(var)
-        
-        # Parse body
-        result = self._parse_expression(body_tokens, parent_context)
-        
-        return {
-            'type': 'exists',
-            'variables': variables,
-            'body': result
-        }
-    
-    def _parse_not(self, tokens: List[str], parent_context: str) -> Dict[str, Any]:
-        """Parse negation - creates a cut."""
-        if len(tokens) < 4:
-            raise Exception("Malformed 'not' expression")
-        
-        # Create cut for negation
-        cut_id = self.editor.add_cut(parent_context)
-        
-        # Parse body within the cut
-        body_tokens = tokens[2:-1]
-        result = self._parse_expression(body_tokens, cut_id)
-        
-        return {
-            'type': 'not',
-            'cut_id': cut_id,
-            'negated': result
-        }
-    
-    def _parse_and(self, tokens: List[str], parent_context: str) -> Dict[str, Any]:
-        """Parse conjunction."""
-        if len(tokens) < 4:
-            raise Exception("Malformed 'and' expression")
-            
-        conjuncts = []
-        inner_tokens = tokens[2:-1]
-        
-        i = 0
-        while i < len(inner_tokens):
-            if inner_tokens[i] == '(':
-                end = self._find_matching_paren(inner_tokens, i)
-                if end == -1:
-                    raise Exception("Unclosed parenthesis in 'and'")
-                expr_tokens = inner_tokens[i:end + 1]
-                i = end + 1
-            else:
-                expr_tokens = [inner_tokens[i]]
-                i += 1
-            
-            if expr_tokens:
-                conjunct_result = self._parse_expression(expr_tokens, parent_context)
-                conjuncts.append(conjunct_result)
-        
-        if not conjuncts:
-            raise Exception("No valid conjuncts found in 'and' expression")
-        
-        return {
-            'type': 'and',
-            'conjuncts': conjuncts
-        }
-    
+
+        if tokens[self._pos] == ')':
+            raise ClifParserError("Malformed 'exists' expression")
+
+        return variables
+
     def _get_or_create_line_for_variable(self, variable: str) -> str:
         """Get or create a line of identity for a variable."""
-        if variable not in self.variable_map:
+        # Single lookup in the hit path (repeated variables are the
+        # common case on the ligature-creation path)
+        line_id = self.variable_map.get(variable)
+        if line_id is None:
             line_id = self._create_line_of_identity()
             self.variable_map[variable] = line_id
-        return self.variable_map[variable]
+        return line_id
     
     def _create_line_of_identity(self) -> str:
         """Create a new line of identity."""
@@ -320,25 +770,18 @@ class ClifParser:
         ligature = self.editor.model.get_object(ligature_id)
         return ligature.line_of_identity_id
     
-    def _find_matching_paren(self, tokens: List[str], start: int) -> int:
-        """Find the index of the matching closing parenthesis."""
-        if start >= len(tokens) or tokens[start] != '(':
-            return -1
-        
-        count = 1
-        for i in range(start + 1, len(tokens)):
-            if tokens[i] == '(':
-                count += 1
-            elif tokens[i] == ')':
-                count -= 1
-                if count == 0:
-                    return i
-        
-        return -1
-    
-    def _find_matching_paren_from_start(self, tokens: List[str], start: int) -> int:
-        """Find the index of the matching closing parenthesis starting from given position."""
-        return self._find_matching_paren(tokens, start)
+# Operator dispatch tables; keys are interned so dict hashing can use
+# identity comparison on the tokenizer's interned operator strings.
+# Leaf operators map to handlers; compound operators map to the state
+# tags driving _parse_expression's explicit work stack.
+ClifParser._DISPATCH = {
+    sys.intern('='): ClifParser._parse_equality,
+}
+ClifParser._COMPOUND = {
+    sys.intern('and'): ClifParser._ST_AND,
+    sys.intern('not'): ClifParser._ST_NOT,
+    sys.intern('exists'): ClifParser._ST_EXISTS,
+}
 
 # Test the CLIF parser
 if __name__ == "__main__":
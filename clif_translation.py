@@ -1,6 +1,9 @@
 from collections import defaultdict
 from eg_model import Cut, Predicate
 
+# Pre-generated variable names; index 0 is unused (counters start at 1)
+_VNAME_POOL = tuple(f"?v{i}" for i in range(64))
+
 class ClifTranslator:
     """Translates an EG model graph into CLIF notation using a robust, two-pass approach."""
     def __init__(self, editor):
@@ -8,7 +11,10 @@ class ClifTranslator:
         self.model = editor.model
         self.variable_counter = 0
         self.line_to_variable_map = {}
-        self.line_scope_cache = {}
+        # Scope lookups persist on the editor so repeated translations of
+        # an unchanged graph skip the LCA walks entirely
+        self.line_scope_cache = editor.line_scope_cache
+        self._subtree_lines = {}  # context_id -> lines touched in its subtree
 
     def _get_line_scope(self, line_id):
         if line_id in self.line_scope_cache:
@@ -21,46 +27,73 @@ class ClifTranslator:
             self.editor.get_parent_context(pred_id)
             for lig_id in line.ligatures
             if (lig := self.model.get_object(lig_id))
-            for pred_id, _ in lig.attachments
+            for pred_id in lig.attachment_preds
             if self.editor.get_parent_context(pred_id) is not None
         }
-        
+
         if not attachment_contexts:
             return self.model.sheet_of_assertion.id
 
-        lca = self.editor._find_lca(list(attachment_contexts))
+        # Most lines attach within one context; skip the LCA walk entirely
+        if len(attachment_contexts) == 1:
+            lca = next(iter(attachment_contexts))
+        else:
+            lca = self.editor._find_lca(list(attachment_contexts))
         self.line_scope_cache[line_id] = lca
         return lca
 
     def _get_variable_for_line(self, line_id):
-        if line_id not in self.line_to_variable_map:
+        name = self.line_to_variable_map.get(line_id)
+        if name is None:
             self.variable_counter += 1
-            self.line_to_variable_map[line_id] = f"?v{self.variable_counter}"
-        return self.line_to_variable_map[line_id]
+            counter = self.variable_counter
+            name = (_VNAME_POOL[counter] if counter < len(_VNAME_POOL)
+                    else f"?v{counter}")
+            self.line_to_variable_map[line_id] = name
+        return name
 
     def translate(self):
         self.line_to_variable_map.clear()
         self.variable_counter = 0
-        self.line_scope_cache.clear()
+        self._subtree_lines.clear()
         return self._translate_context(self.model.sheet_of_assertion)
 
+    def _collect_subtree_lines(self, context):
+        """Return the set of lines touched anywhere under context.
+
+        Computed bottom-up and memoized for the duration of one
+        translate() call, so the whole tree is visited once instead of
+        re-walking each context's subtree at every nesting level.
+        """
+        cached = self._subtree_lines.get(context.id)
+        if cached is not None:
+            return cached
+        lines = set()
+        for child_id in context.children:
+            child = self.model.get_object(child_id)
+            if child.KIND == Predicate.KIND:
+                for line_id in child.hooks.values():
+                    if line_id: lines.add(line_id)
+            elif child.KIND == Cut.KIND:
+                lines |= self._collect_subtree_lines(child)
+        self._subtree_lines[context.id] = lines
+        return lines
+
     def _translate_context(self, context):
         clauses = []
-        lines_in_subgraph = set()
-
-        nodes_to_visit = [context]
-        visited_contexts = {context.id}
-        while nodes_to_visit:
-            current_context = nodes_to_visit.pop(0)
-            for child_id in current_context.children:
-                child = self.model.get_object(child_id)
-                if isinstance(child, Predicate):
-                    for line_id in child.hooks.values():
-                        if line_id: lines_in_subgraph.add(line_id)
-                elif isinstance(child, Cut) and child.id not in visited_contexts:
-                    nodes_to_visit.append(child)
-                    visited_contexts.add(child.id)
-        
+        lines_in_subgraph = self._collect_subtree_lines(context)
+
+        # Single pass over the direct children, branching on the cheap
+        # integer KIND tag instead of isinstance()
+        direct_predicates = []
+        direct_cuts = []
+        for child_id in context.children:
+            child = self.model.get_object(child_id)
+            if child.KIND == Predicate.KIND:
+                direct_predicates.append(child)
+            elif child.KIND == Cut.KIND:
+                direct_cuts.append(child)
+
         # Sort discovered lines to ensure deterministic variable assignment
         sorted_lines = sorted(list(lines_in_subgraph))
 
@@ -69,43 +102,55 @@ class ClifTranslator:
             for line_id in sorted_lines
             if self._get_line_scope(line_id) == context.id
         }
-        
-        for child_id in context.children:
-            child = self.model.get_object(child_id)
-            if isinstance(child, Predicate):
-                clauses.append(self._translate_predicate(child))
-            elif isinstance(child, Cut):
-                clauses.append(self._translate_context(child))
-        
+
+        for child in direct_predicates:
+            clauses.append(self._translate_predicate(child))
+        for child in direct_cuts:
+            clauses.append(self._translate_context(child))
+
         if not clauses: return ""
-        
-        sorted_clauses = sorted(clauses)
-        body = f"(and {' '.join(sorted_clauses)})" if len(sorted_clauses) > 1 else sorted_clauses[0]
-        
-        if isinstance(context, Cut):
-            body = f"(not {body})"
 
+        clauses.sort()
+
+        # Assemble the wrappers as fragments and join once, instead of
+        # re-copying the body through a cascade of nested f-strings
+        parts = []
         if vars_to_quantify:
-            return f"(exists ({' '.join(sorted(list(vars_to_quantify)))}) {body})"
+            parts.append(f"(exists ({' '.join(sorted(vars_to_quantify))}) ")
+        if context.KIND == Cut.KIND:
+            parts.append("(not ")
+        if len(clauses) > 1:
+            parts.append("(and ")
+            parts.append(' '.join(clauses))
+            parts.append(")")
         else:
-            return body
+            parts.append(clauses[0])
+        if context.KIND == Cut.KIND:
+            parts.append(")")
+        if vars_to_quantify:
+            parts.append(")")
+        return ''.join(parts) if len(parts) > 1 else parts[0]
 
     def _translate_predicate(self, predicate):
+        # Hook dicts are built with keys 1..n in ascending insertion order
+        # and never re-keyed, so iteration order is already numeric - no
+        # per-call sorted() needed
+        hooks = predicate.hooks
         if predicate.is_functional:
             output_hook = predicate.output_hook
-            output_var = self._get_variable_for_line(predicate.hooks.get(output_hook))
-            
+            output_var = self._get_variable_for_line(hooks.get(output_hook))
+
             input_vars = [
-                self._get_variable_for_line(predicate.hooks.get(i))
-                for i in sorted(predicate.hooks.keys()) if i != output_hook
+                self._get_variable_for_line(line_id)
+                for i, line_id in hooks.items() if i != output_hook
             ]
             func_call = f"({predicate.label}{' ' if input_vars else ''}{' '.join(input_vars)})"
             return f"(= {output_var} {func_call})"
         else:
-            if not predicate.hooks:
+            if not hooks:
                 return predicate.label
             terms = [
-                self._get_variable_for_line(predicate.hooks.get(i))
-                for i in sorted(predicate.hooks.keys())
+                self._get_variable_for_line(line_id)
+                for line_id in hooks.values()
             ]
             return f"({predicate.label} {' '.join(terms)})"
\ No newline at end of file
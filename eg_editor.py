@@ -8,6 +8,12 @@ class EGEditor:
     def __init__(self):
         self.model = GraphModel()
         self.validator = Validator(self)
+        # Memoized line_id -> scope context, shared with the translator and
+        # kept across translate() calls; busted whenever the graph mutates
+        self.line_scope_cache = {}
+
+    def invalidate_scope_cache(self):
+        self.line_scope_cache.clear()
 
     def add_constant(self, constant_name, parent_id='SA'):
         """Implements the Existence of Constants Rule correctly."""
@@ -28,8 +34,8 @@ class EGEditor:
             line = self.model.get_object(line_id)
             # A standalone constant's line will have exactly one ligature with one attachment.
             if line and len(line.ligatures) == 1:
-                lig = self.model.get_object(list(line.ligatures)[0])
-                if lig and len(lig.attachments) == 1:
+                lig = self.model.get_object(next(iter(line.ligatures)))
+                if lig and len(lig.attachment_preds) == 1:
                     self.model.remove_object(lig.id)
                     self.model.remove_object(line_id)
                 else:
@@ -39,7 +45,7 @@ class EGEditor:
         # Finally, remove the predicate itself and its reference in the parent
         parent_id = self.get_parent_context(predicate_id)
         if parent_id:
-            self.model.get_object(parent_id).children.remove(predicate_id)
+            self.model.get_object(parent_id).remove_child(predicate_id)
         self.model.remove_object(predicate_id)
 
 
@@ -47,34 +53,90 @@ class EGEditor:
         func_pred_id = self.add_predicate(function_name, arity, parent_id, is_functional=True)
         func_pred = self.model.get_object(func_pred_id)
         for i, line_id in enumerate(input_line_ids):
-            func_pred.hooks[i + 1] = line_id
+            self._set_hook(func_pred, i + 1, line_id)
         output_line = LineOfIdentity()
         self.model.add_object(output_line)
-        func_pred.hooks[arity] = output_line.id
+        self._set_hook(func_pred, arity, output_line.id)
         return func_pred_id
 
+    def _set_hook(self, pred, hook_index, line_id):
+        """Write a predicate hook, keeping the line->hook reverse index current."""
+        old_line_id = pred.hooks.get(hook_index)
+        if old_line_id:
+            self.model.unregister_hook(old_line_id, pred.id, hook_index)
+        pred.hooks[hook_index] = line_id
+        if line_id:
+            self.model.register_hook(line_id, pred.id, hook_index)
+
+    def _bind_hook(self, pred_id, hook_index, line_id):
+        """Fast path for graph construction (used by the CLIF parser).
+
+        The caller already knows which line the hook belongs to, so this
+        skips connect()'s line discovery and merge scan entirely: it
+        writes the hook, attaches it to the line's ligature, and only
+        recomputes traversed cuts once the ligature spans several hooks.
+        """
+        pred = self.model.get_object(pred_id)
+        line = self.model.get_object(line_id)
+        if not pred or not line: return None
+        self._set_hook(pred, hook_index, line_id)
+        if line.ligatures:
+            ligature = self.model.get_object(next(iter(line.ligatures)))
+        else:
+            ligature = Ligature(line_id)
+            self.model.add_object(ligature)
+            line.ligatures.add(ligature.id)
+        ligature.add_attachment(pred_id, hook_index)
+        if len(ligature.attachment_preds) > 1:
+            self._calculate_traversed_cuts(ligature)
+        self.invalidate_scope_cache()
+        return ligature.id
+
     def get_parent_context(self, obj_id):
-        for parent in self.model.objects.values():
-            if hasattr(parent, 'children') and obj_id in parent.children:
-                return parent.id
-        return None
+        obj = self.model.get_object(obj_id)
+        return obj.parent_id if obj else None
         
     def add_cut(self, parent_id='SA'):
         parent = self.model.get_object(parent_id)
         if not parent or not hasattr(parent, 'children'): raise ValueError("Parent context not found or invalid.")
         cut = Cut(parent_id=parent_id)
         self.model.add_object(cut)
-        parent.children.add(cut.id)
+        parent.add_child(cut.id)
+        self.validator.invalidate_depth_cache()
+        self.invalidate_scope_cache()
         return cut.id
 
     def add_predicate(self, label, hooks, parent_id='SA', p_type='relation', is_functional=False):
         parent = self.model.get_object(parent_id)
         if not parent or not hasattr(parent, 'children'): raise ValueError("Parent context not found or invalid.")
         predicate = Predicate(label, hooks, p_type=p_type, is_functional=is_functional)
+        predicate.parent_id = parent_id
         self.model.add_object(predicate)
-        parent.children.add(predicate.id)
+        parent.add_child(predicate.id)
         return predicate.id
 
+    def add_predicates(self, specs):
+        """Add several predicates in one call.
+
+        specs is a list of (label, hooks, parent_id) tuples; returns the new
+        predicate ids in the same order. Each distinct parent context is
+        looked up and validated once instead of once per predicate.
+        """
+        parents = {}
+        ids = []
+        for label, hooks, parent_id in specs:
+            parent = parents.get(parent_id)
+            if parent is None:
+                parent = self.model.get_object(parent_id)
+                if not parent or not hasattr(parent, 'children'): raise ValueError("Parent context not found or invalid.")
+                parents[parent_id] = parent
+            predicate = Predicate(label, hooks)
+            predicate.parent_id = parent_id
+            self.model.add_object(predicate)
+            parent.add_child(predicate.id)
+            ids.append(predicate.id)
+        return ids
+
     def add_ligature(self, parent_id='SA'):
         line = LineOfIdentity()
         self.model.add_object(line)
@@ -101,13 +163,15 @@ class EGEditor:
             existing_line_id = pred.hooks.get(hook_index)
             if existing_line_id and existing_line_id != primary_line_id:
                 self._merge_lines(primary_line_id, existing_line_id)
-            pred.hooks[hook_index] = primary_line_id
+            self._set_hook(pred, hook_index, primary_line_id)
         new_ligature = Ligature(primary_line_id)
-        new_ligature.attachments.update(pred_hook_pairs)
+        for p_id, h_index in pred_hook_pairs:
+            new_ligature.add_attachment(p_id, h_index)
         self.model.add_object(new_ligature)
         primary_line = self.model.get_object(primary_line_id)
         primary_line.ligatures.add(new_ligature.id)
         self._calculate_traversed_cuts(new_ligature)
+        self.invalidate_scope_cache()
         return new_ligature.id
 
     def _merge_lines(self, primary_line_id, other_line_id):
@@ -119,12 +183,14 @@ class EGEditor:
             if lig:
                 lig.line_of_identity_id = primary_line_id
                 primary_line.ligatures.add(lig_id)
-        for obj in self.model.objects.values():
-            if isinstance(obj, Predicate):
-                for hook, line_id in obj.hooks.items():
-                    if line_id == other_line_id:
-                        obj.hooks[hook] = primary_line_id
+        # Rewrite only the hooks known to reference the merged line
+        for pred_id, hook in list(self.model.line_to_hooks.get(other_line_id, ())):
+            pred = self.model.get_object(pred_id)
+            if pred and pred.hooks.get(hook) == other_line_id:
+                self._set_hook(pred, hook, primary_line_id)
+        self.model.line_to_hooks.pop(other_line_id, None)
         self.model.remove_object(other_line_id)
+        self.invalidate_scope_cache()
     
     def _get_ancestors(self, context_id):
         ancestors = []
@@ -136,16 +202,30 @@ class EGEditor:
 
     def _find_lca(self, context_ids):
         if not context_ids: return None
-        paths = [self._get_ancestors(cid) for cid in context_ids]
-        lca_path = paths[0]
-        for path in paths[1:]:
-            lca_path = [node for node in lca_path if node in path]
-        return lca_path[0] if lca_path else None
+        # Pairwise two-pointer climb: level both nodes to equal depth,
+        # then walk up in lockstep - O(depth) with no path allocations
+        depth_of = self.validator.get_context_depth
+        parent_of = self.get_parent_context
+        lca = context_ids[0]
+        for other in context_ids[1:]:
+            if other == lca: continue
+            a, b = lca, other
+            depth_a, depth_b = depth_of(a), depth_of(b)
+            while depth_a > depth_b:
+                a = parent_of(a); depth_a -= 1
+            while depth_b > depth_a:
+                b = parent_of(b); depth_b -= 1
+            while a != b and a is not None and b is not None:
+                a = parent_of(a)
+                b = parent_of(b)
+            if a != b: return None
+            lca = a
+        return lca
 
     def _calculate_traversed_cuts(self, ligature):
-        attachments = list(ligature.attachments)
-        if len(attachments) < 2: return
-        context_ids = [self.get_parent_context(pred_id) for pred_id, _ in attachments]
+        if len(ligature.attachment_preds) < 2: return
+        context_ids = [self.get_parent_context(pred_id)
+                       for pred_id in ligature.attachment_preds]
         lca_id = self._find_lca(context_ids)
         traversed = set()
         for cid in context_ids:
@@ -165,38 +245,52 @@ class EGEditor:
             original_parent = self.model.get_object(parent_id)
             inner_cut = self.model.get_object(inner_cut_id)
             for obj_id in selection_ids:
-                if obj_id in original_parent.children: original_parent.children.remove(obj_id)
-                inner_cut.children.add(obj_id)
+                original_parent.remove_child(obj_id)
+                inner_cut.add_child(obj_id)
+                moved = self.model.get_object(obj_id)
+                if moved: moved.parent_id = inner_cut_id
+            self.validator.invalidate_depth_cache()
+            self.invalidate_scope_cache()
         return outer_cut_id, inner_cut_id
 
     def remove_double_cut(self, outer_cut_id):
         if not self.validator.can_remove_double_cut(outer_cut_id): raise ValueError("Not a valid double cut.")
         outer_cut = self.model.get_object(outer_cut_id)
-        inner_cut_id = list(outer_cut.children)[0]
+        inner_cut_id = outer_cut.children[0]
         inner_cut = self.model.get_object(inner_cut_id)
         parent_id = self.get_parent_context(outer_cut_id)
         parent = self.model.get_object(parent_id)
         for child_id in list(inner_cut.children):
-            inner_cut.children.remove(child_id)
-            parent.children.add(child_id)
-        parent.children.remove(outer_cut_id)
+            inner_cut.remove_child(child_id)
+            parent.add_child(child_id)
+            child = self.model.get_object(child_id)
+            if child: child.parent_id = parent_id
+        parent.remove_child(outer_cut_id)
         self.model.remove_object(outer_cut_id)
         self.model.remove_object(inner_cut_id)
+        self.validator.invalidate_depth_cache()
+        self.invalidate_scope_cache()
 
     def iterate(self, selection_ids, target_context_id):
         if not self.validator.can_iterate(selection_ids, target_context_id): raise ValueError("Iteration not valid.")
         id_map = {obj_id: str(uuid.uuid4()) for obj_id in selection_ids}
         for obj_id in selection_ids:
             original_obj = self.model.get_object(obj_id)
-            new_obj = copy.deepcopy(original_obj)
+            if isinstance(original_obj, Predicate):
+                new_obj = original_obj.clone(target_context_id)
+            else:
+                new_obj = copy.deepcopy(original_obj)
             new_obj.id = id_map[obj_id]
+            new_obj.parent_id = target_context_id
             target_parent = self.model.get_object(target_context_id)
-            target_parent.children.add(new_obj.id)
+            target_parent.add_child(new_obj.id)
             self.model.add_object(new_obj)
             if isinstance(new_obj, Predicate):
                 for hook_index, line_id in original_obj.hooks.items():
                     if line_id:
-                        new_obj.hooks[hook_index] = line_id
+                        self._set_hook(new_obj, hook_index, line_id)
+        self.validator.invalidate_depth_cache()
+        self.invalidate_scope_cache()
 
     def apply_functional_property_rule(self, pred1_id, pred2_id):
         if not self.validator.can_apply_functional_property_rule(pred1_id, pred2_id): raise ValueError("Cannot apply rule.")
@@ -4,17 +4,35 @@ class Validator:
     """Contains methods to validate transformation rule preconditions."""
     def __init__(self, editor):
         self.editor = editor
+        # Memoized context depths; the editor invalidates this whenever
+        # cut structure changes (add/insert/remove cut, iterate)
+        self._depth_cache = {}
+
+    def invalidate_depth_cache(self):
+        self._depth_cache.clear()
 
     def get_context_depth(self, context_id):
+        cached = self._depth_cache.get(context_id)
+        if cached is not None:
+            return cached
         depth = 0
         current_id = context_id
+        # Walk up until a cached ancestor or the sheet of assertion
+        walked = []
         while current_id is not None and current_id != self.editor.model.sheet_of_assertion.id:
+            cached = self._depth_cache.get(current_id)
+            if cached is not None:
+                depth = cached
+                break
             parent_id = self.editor.get_parent_context(current_id)
             if parent_id is None: # Should only happen for SA
                 break
-            depth += 1
+            walked.append(current_id)
             current_id = parent_id
-        return depth
+        # Cache depths for the whole walked chain
+        for i, cid in enumerate(reversed(walked)):
+            self._depth_cache[cid] = depth + i + 1
+        return self._depth_cache.get(context_id, depth)
 
     def is_positive_context(self, context_id):
         return self.get_context_depth(context_id) % 2 == 0
@@ -61,7 +79,7 @@ class Validator:
         if not isinstance(outer_cut, Cut) or len(outer_cut.children) != 1:
             return False
         
-        inner_cut_id = list(outer_cut.children)[0]
+        inner_cut_id = outer_cut.children[0]
         inner_cut = self.editor.model.get_object(inner_cut_id)
         if not isinstance(inner_cut, Cut):
             return False
@@ -1,17 +1,38 @@
 import uuid
 
 class GraphObject:
-    def __init__(self, obj_id=None):
+    # Small integer type tag; cheaper to branch on than isinstance()
+    KIND = 0
+
+    def __init__(self, obj_id=None, parent_id=None):
         self.id = obj_id if obj_id else str(uuid.uuid4())
+        # Direct pointer to the enclosing context; maintained by EGEditor
+        # whenever an object enters or leaves a context's children set
+        self.parent_id = parent_id
 
 class Context(GraphObject):
     def __init__(self, obj_id=None, parent_id=None):
-        super().__init__(obj_id)
-        self.parent_id = parent_id
-        self.children = set()
+        super().__init__(obj_id, parent_id)
+        # Insertion-ordered for deterministic, cache-friendly iteration;
+        # the sidecar set keeps membership tests O(1)
+        self.children = []
+        self._children_set = set()
+
+    def add_child(self, child_id):
+        if child_id not in self._children_set:
+            self._children_set.add(child_id)
+            self.children.append(child_id)
+
+    def remove_child(self, child_id):
+        if child_id in self._children_set:
+            self._children_set.discard(child_id)
+            self.children.remove(child_id)
+
+    def has_child(self, child_id):
+        return child_id in self._children_set
 
 class Cut(Context):
-    pass
+    KIND = 2
 
 class LineOfIdentity(GraphObject):
     def __init__(self, obj_id=None):
@@ -22,10 +43,29 @@ class Ligature(GraphObject):
     def __init__(self, line_of_identity_id, obj_id=None):
         super().__init__(obj_id)
         self.line_of_identity_id = line_of_identity_id
-        self.attachments = set()
+        # Attachments in struct-of-arrays form: the parallel pred/hook
+        # lists iterate contiguously without a tuple per attachment; the
+        # sidecar set only backs deduplication on insert
+        self.attachment_preds = []
+        self.attachment_hooks = []
+        self._attachment_set = set()
         self.traversed_cuts = set() # This attribute is needed for traversal logic
 
+    def add_attachment(self, pred_id, hook_index):
+        key = (pred_id, hook_index)
+        if key not in self._attachment_set:
+            self._attachment_set.add(key)
+            self.attachment_preds.append(pred_id)
+            self.attachment_hooks.append(hook_index)
+
+    @property
+    def attachments(self):
+        """Attachment (pred_id, hook_index) pairs, in insertion order."""
+        return list(zip(self.attachment_preds, self.attachment_hooks))
+
 class Predicate(GraphObject):
+    KIND = 1
+
     def __init__(self, label, hooks, obj_id=None, p_type='relation', is_functional=False):
         super().__init__(obj_id)
         self.label = label
@@ -33,6 +73,14 @@ class Predicate(GraphObject):
         self.p_type = p_type
         self.is_functional = is_functional
 
+    def clone(self, new_parent_id=None):
+        """Structural copy with a fresh id; far cheaper than deepcopy."""
+        copied = Predicate(self.label, 0, p_type=self.p_type,
+                           is_functional=self.is_functional)
+        copied.hooks = dict(self.hooks)
+        copied.parent_id = new_parent_id
+        return copied
+
     @property
     def output_hook(self):
         if self.is_functional:
@@ -42,6 +90,9 @@ class Predicate(GraphObject):
 class GraphModel:
     def __init__(self):
         self.objects = {}
+        # Reverse index: line_id -> set of (pred_id, hook_index) using it,
+        # kept current by EGEditor so line merges avoid full-model scans
+        self.line_to_hooks = {}
         self.sheet_of_assertion = Context(obj_id='SA')
         self.add_object(self.sheet_of_assertion)
 
@@ -55,4 +106,14 @@ class GraphModel:
 
     def remove_object(self, obj_id):
         if obj_id in self.objects:
-            del self.objects[obj_id]
\ No newline at end of file
+            del self.objects[obj_id]
+
+    def register_hook(self, line_id, pred_id, hook_index):
+        self.line_to_hooks.setdefault(line_id, set()).add((pred_id, hook_index))
+
+    def unregister_hook(self, line_id, pred_id, hook_index):
+        hooks = self.line_to_hooks.get(line_id)
+        if hooks:
+            hooks.discard((pred_id, hook_index))
+            if not hooks:
+                del self.line_to_hooks[line_id]
\ No newline at end of file
@@ -3,14 +3,90 @@ Existential Graph Renderer
 Integrates all fixes for proper EG representation.
 """
 
+from collections import OrderedDict, defaultdict
+from functools import reduce
+
 from PySide6.QtCore import QPointF, QRectF
-from PySide6.QtWidgets import QGraphicsScene
-from graphics_items import (PredicateItem, CutItem, 
-                           LigatureItem, InteractionMode)
+from PySide6.QtWidgets import QGraphicsItem, QGraphicsScene
+from graphics_items import (PredicateItem, CutItem,
+                           LigatureItem, BatchLigatureItem, InteractionMode)
 from line_of_identity_item import LineOfIdentityItem, StandaloneLineOfIdentityItem
 from eg_model import GraphModel, Cut, Predicate, LineOfIdentity, Ligature
 import math
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None and np is not None:
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _separate(cx, cy, hw, hh, total_x, total_y, max_iters, epsilon,
+                  start_temp):
+        """Iterated pairwise separation over center/half-extent arrays.
+
+        Mutates cx/cy in place per iteration and accumulates the applied
+        displacement into total_x/total_y; rows are processed in
+        parallel. Mirrors the NumPy broadcast pass exactly, including
+        the fixed horizontal push for coincident centers.
+        """
+        n = cx.shape[0]
+        step_x = np.zeros(n, dtype=np.float32)
+        step_y = np.zeros(n, dtype=np.float32)
+        for it in range(max_iters):
+            for i in prange(n):
+                sx = np.float32(0.0)
+                sy = np.float32(0.0)
+                for j in range(n):
+                    if j == i:
+                        continue
+                    dx = cx[j] - cx[i]
+                    dy = cy[j] - cy[i]
+                    if abs(dx) < hw[i] + hw[j] and abs(dy) < hh[i] + hh[j]:
+                        if dx * dx + dy * dy < 1.0:
+                            # Antisymmetric horizontal push for coincident
+                            # centers, matching the NumPy path: lower index
+                            # goes left, higher right
+                            if j > i:
+                                dx = np.float32(80.0)
+                            else:
+                                dx = np.float32(-80.0)
+                            dy = np.float32(0.0)
+                        length = (dx * dx + dy * dy) ** 0.5
+                        if length == 0.0:
+                            length = np.float32(1.0)
+                        sx += dx / length * np.float32(90.0)
+                        sy += dy / length * np.float32(50.0)
+                step_x[i] = sx * np.float32(-0.5)
+                step_y[i] = sy * np.float32(-0.5)
+            max_mag = np.float32(0.0)
+            for i in range(n):
+                mag = (step_x[i] * step_x[i] + step_y[i] * step_y[i]) ** 0.5
+                if mag > max_mag:
+                    max_mag = mag
+            if max_mag < epsilon:
+                break
+            temp = start_temp * (np.float32(1.0) - np.float32(it) / max_iters)
+            for i in range(n):
+                mag = (step_x[i] * step_x[i] + step_y[i] * step_y[i]) ** 0.5
+                if mag > temp:
+                    scale = temp / mag
+                else:
+                    scale = np.float32(1.0)
+                sx = step_x[i] * scale
+                sy = step_y[i] * scale
+                cx[i] += sx
+                cy[i] += sy
+                total_x[i] += sx
+                total_y[i] += sy
+else:
+    _separate = None
+
 class EGRenderer:
     """
     Renderer that properly handles all identified issues:
@@ -27,174 +103,366 @@ class EGRenderer:
         self.graphics_items = {}  # Maps object IDs to graphics items
         self.line_items = {}      # Maps line IDs to line graphics items
         self.ligature_items = {}  # Maps ligature IDs to ligature graphics items
-        
+
+        # When enabled, all ligatures share one batched graphics item
+        self.batch_mode = False
+
+        # Cache mode applied to every created item (None leaves Qt's
+        # default). Device-coordinate caching rasterizes each item once,
+        # so static predicates and cuts repaint from pixmaps
+        self.default_cache_mode = QGraphicsItem.CacheMode.DeviceCoordinateCache
+
+        # EG scenes are small and the layout pass moves items around, so
+        # a BSP index costs rebalances without speeding lookups
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+
+        # Bumped whenever scene content changes; lets views cache geometry
+        self.mutation_gen = 0
+
+        # Final predicate positions keyed by a structural hash of the
+        # model, LRU-capped; re-rendering an unchanged graph reapplies
+        # the stored layout instead of re-running separation
+        self._layout_cache = OrderedDict()
+        self._layout_cache_max = 32
+
+        # Survivor pool populated at the start of each render; creation
+        # paths pop matching items from it instead of constructing new
+        # C++-backed ones (crossing the binding layer twice per item)
+        self._recycle = {}
+
+        # 'text' for live QGraphicsTextItem labels, 'pixmap' for cached rasters
+        self.text_mode = 'text'
+
+        # Leaf-kind -> renderer, resolved once instead of a string
+        # comparison chain per AST node; compound kinds (and/not/exists)
+        # are driven by _render_expression_tree's work stack
+        self._render_dispatch = {
+            'constant': self._render_constant,
+            'predicate': self._render_predicate,
+            'equality': self._render_equality,
+        }
+
         # Layout parameters
         self.predicate_spacing = 120
         self.cut_padding = 40
         self.vertical_spacing = 80
         self.line_length = 30
         
+    def set_batch_mode(self, enabled):
+        """Enable drawing all ligature segments through one batched item."""
+        self.batch_mode = enabled
+
+    def _add_item(self, item):
+        """Add an item to the scene, applying the default cache mode."""
+        if self.default_cache_mode is not None:
+            item.setCacheMode(self.default_cache_mode)
+        # Back-pointer so movable items bump mutation_gen when dragged
+        item.renderer = self
+        self.scene.addItem(item)
+        self.mutation_gen += 1
+
     def clear(self):
         """Clear all rendered items."""
         self.scene.clear()
         self.graphics_items.clear()
         self.line_items.clear()
         self.ligature_items.clear()
-        
+        self._recycle = {}
+        self.mutation_gen += 1
+
+    def _begin_item_reuse(self):
+        """Start a render, keeping last render's predicate/cut items poolable.
+
+        Predicates and cuts survive unchanged across re-renders of a
+        mostly-stable model, so they are parked in the reuse pool rather
+        than destroyed. Lines and ligatures re-route from scratch every
+        render (their geometry depends on final hook positions) and are
+        few, so they are simply removed.
+        """
+        self._recycle = self.graphics_items
+        self.graphics_items = {}
+        for item in self.line_items.values():
+            self.scene.removeItem(item)
+        # The batch ligature item is mapped under many ids; dedupe
+        for item in set(self.ligature_items.values()):
+            self.scene.removeItem(item)
+        self.line_items.clear()
+        self.ligature_items.clear()
+        self.mutation_gen += 1
+
+    def _finish_item_reuse(self):
+        """Remove pool leftovers whose model objects disappeared."""
+        for item in self._recycle.values():
+            self.scene.removeItem(item)
+        if self._recycle:
+            self.mutation_gen += 1
+        self._recycle = {}
+
     def render_from_parse_result(self, parse_result):
         """Render from a final corrected CLIF parser result."""
         if not parse_result.get('success', False):
             return False
-            
-        self.clear()
-        
-        # Render the main expression
-        root_result = parse_result['result']
-        self._render_expression_tree(root_result, QPointF(0, 0))
-        
-        # Create lines of identity for all variables with proper visibility
-        variable_map = parse_result.get('variable_map', {})
-        hook_connections = parse_result.get('hook_connections', {})
-        self._create_visible_lines_of_identity(variable_map, hook_connections)
-        
-        # Create ligatures with proper hook connections
-        self._create_proper_ligatures(parse_result)
-        
-        # Optimize layout
-        self._optimize_layout()
-        
+
+        # Suspend view repaints and scene change signals for the whole
+        # batch; every addItem/setPos below would otherwise emit its own
+        # invalidation. One scene update is issued at the end instead.
+        views = self.scene.views()
+        for view in views:
+            view.setUpdatesEnabled(False)
+        self.scene.blockSignals(True)
+        # Drop the BSP index during the bulk addItem sweep; rebuilding it
+        # once on restore is cheaper than N incremental inserts
+        index_method = self.scene.itemIndexMethod()
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        try:
+            self._begin_item_reuse()
+
+            # Render the main expression (flat node list, root index)
+            nodes = parse_result['nodes']
+            self._render_expression_tree(nodes, parse_result['root'], (0.0, 0.0))
+
+            # Create lines of identity for all variables with proper visibility
+            variable_map = parse_result.get('variable_map', {})
+            hook_connections = parse_result.get('hook_connections', {})
+
+            # Reverse index built once per render and shared by everything
+            # below: line_id -> [(pred_id, hook_index), ...]
+            line_to_hooks = defaultdict(list)
+            for (pred_id, hook_index), line_id in hook_connections.items():
+                line_to_hooks[line_id].append((pred_id, hook_index))
+            self._line_to_hooks = line_to_hooks
+
+            self._create_visible_lines_of_identity(variable_map, line_to_hooks)
+
+            # Create ligatures with proper hook connections
+            self._create_proper_ligatures(line_to_hooks)
+
+            # Items left in the pool belong to objects no longer present
+            self._finish_item_reuse()
+
+            # Optimize layout; a lone item cannot overlap anything, so
+            # the tiny-graph common case skips the pass entirely
+            if len(self.graphics_items) > 1:
+                key = self._layout_key()
+                cached = self._layout_cache.get(key)
+                if cached is not None:
+                    self._layout_cache.move_to_end(key)
+                    self._apply_cached_layout(cached)
+                else:
+                    self._optimize_layout()
+                    self._layout_cache[key] = {
+                        obj_id: (item.pos().x(), item.pos().y())
+                        for obj_id, item in self.graphics_items.items()
+                        if item.KIND == PredicateItem.KIND}
+                    if len(self._layout_cache) > self._layout_cache_max:
+                        self._layout_cache.popitem(last=False)
+        finally:
+            self.scene.setItemIndexMethod(index_method)
+            self.scene.blockSignals(False)
+            for view in views:
+                view.setUpdatesEnabled(True)
+            self.scene.update()
+
         return True
         
-    def _render_expression_tree(self, expr_result, position):
-        """Render an expression tree recursively."""
-        expr_type = expr_result.get('type', '')
-        
-        if expr_type == 'constant':
-            return self._render_constant(expr_result, position)
-        elif expr_type == 'predicate':
-            return self._render_predicate(expr_result, position)
-        elif expr_type == 'and':
-            return self._render_conjunction(expr_result, position)
-        elif expr_type == 'not':
-            return self._render_negation(expr_result, position)
-        elif expr_type == 'exists':
-            return self._render_existential(expr_result, position)
-        elif expr_type == 'equality':
-            return self._render_equality(expr_result, position)
-            
-        return None
-        
-    def _render_constant(self, expr_result, position):
+    # Work-stack phases for _render_expression_tree
+    _PH_VISIT = 0
+    _PH_REDUCE = 1
+
+    def _render_expression_tree(self, nodes, index, position):
+        """Render an expression subtree rooted at nodes[index].
+
+        Driven by an explicit descend/reduce work stack instead of
+        recursion: leaves render on first visit, compound nodes push a
+        reduce frame plus their children and assemble once every child
+        result is in. Nesting depth is bounded by the stack list, not
+        the interpreter's recursion limit. Positions travel as plain
+        (x, y) tuples; QPointF is only materialized where Qt needs it.
+
+        Each result is an (items, bbox) pair with bbox a
+        (minx, miny, maxx, maxy) tuple or None. Leaf bounds are read
+        from Qt once at creation and folded upward analytically, so cut
+        sizing never re-unions rects at every nesting level.
+        """
+        empty = ([], None)
+        results = {}
+        stack = [(self._PH_VISIT, index, position)]
+        while stack:
+            phase, idx, pos = stack.pop()
+            node = nodes[idx]
+            kind = node.kind
+
+            if phase == self._PH_VISIT:
+                if kind == 'and':
+                    conjuncts = node.children
+                    stack.append((self._PH_REDUCE, idx, pos))
+                    if len(conjuncts) == 1:
+                        # Degenerate conjunction: no spreading to compute
+                        stack.append((self._PH_VISIT, conjuncts[0], pos))
+                        continue
+                    # Conjuncts spread horizontally around the center
+                    x, y = pos
+                    start_x = x - len(conjuncts) * self.predicate_spacing / 2
+                    for i in range(len(conjuncts) - 1, -1, -1):
+                        child_pos = (start_x + i * self.predicate_spacing, y)
+                        stack.append((self._PH_VISIT, conjuncts[i], child_pos))
+                elif kind == 'not':
+                    stack.append((self._PH_REDUCE, idx, pos))
+                    if node.children:
+                        stack.append((self._PH_VISIT, node.children[0], pos))
+                elif kind == 'exists':
+                    # Existential quantification is implicit in EG
+                    stack.append((self._PH_REDUCE, idx, pos))
+                    stack.append((self._PH_VISIT, node.children[0], pos))
+                else:
+                    handler = self._render_dispatch.get(kind)
+                    items = handler(nodes, node, pos) if handler else []
+                    bbox = None
+                    for item in items:
+                        rect = item.sceneBoundingRect()
+                        bbox = self._union_bbox(
+                            bbox, (rect.left(), rect.top(),
+                                   rect.right(), rect.bottom()))
+                    results[idx] = (items, bbox)
+            elif kind == 'and':
+                rendered_items = []
+                bbox = None
+                for child in node.children:
+                    child_items, child_bbox = results.get(child) or empty
+                    rendered_items.extend(child_items)
+                    bbox = self._union_bbox(bbox, child_bbox)
+                results[idx] = (rendered_items, bbox)
+            elif kind == 'not':
+                _, child_bbox = ((results.get(node.children[0]) or empty)
+                                 if node.children else empty)
+                results[idx] = self._materialize_cut(node, pos, child_bbox)
+            else:  # exists
+                results[idx] = results.get(node.children[0]) or empty
+        return (results.get(index) or empty)[0]
+
+    @staticmethod
+    def _union_bbox(a, b):
+        """Merge two (minx, miny, maxx, maxy) tuples; either may be None."""
+        if a is None:
+            return b
+        if b is None:
+            return a
+        return (min(a[0], b[0]), min(a[1], b[1]),
+                max(a[2], b[2]), max(a[3], b[3]))
+
+    def _render_constant(self, nodes, node, position):
         """Render a constant as a predicate."""
-        pred_id = expr_result['predicate_id']
-        name = expr_result['name']
-        
-        pred_item = PredicateItem(
-            pred_id, name.capitalize(), 0, position.x(), position.y(), self.editor
-        )
-        
-        self.scene.addItem(pred_item)
+        pred_id = node.pred_id
+        name = node.name
+
+        x, y = position
+        pred_item = self._reuse_predicate_item(pred_id, x, y)
+        if pred_item is None:
+            pred_item = PredicateItem(
+                pred_id, name.capitalize(), 0, x, y, self.editor,
+                text_mode=self.text_mode
+            )
+            self._add_item(pred_item)
         self.graphics_items[pred_id] = pred_item
-        
+
+        return [pred_item]
+
+    def _reuse_predicate_item(self, pred_id, x, y):
+        """Reposition last render's item for pred_id, if one survives.
+
+        The id identifies the same model object, so label and arity are
+        unchanged; only the position and the connection sets (rebuilt
+        along with the lines/ligatures every render) need resetting.
+        """
+        pred_item = self._recycle.pop(pred_id, None)
+        if pred_item is None:
+            return None
+        pred_item.connected_lines.clear()
+        pred_item.connected_ligatures.clear()
+        # Skip constraint validation: parent cut rects are only updated
+        # later in this render pass, so they are stale at this point
+        pred_item._validation_disabled = True
+        pred_item.setPos(x, y)
+        pred_item._validation_disabled = False
         return pred_item
-        
-    def _render_predicate(self, expr_result, position):
+
+    def _render_predicate(self, nodes, node, position):
         """Render a predicate with proper hook connections."""
-        pred_id = expr_result['predicate_id']
-        name = expr_result['name']
-        arity = expr_result['arity']
-        
-        pred_item = PredicateItem(
-            pred_id, name, arity, position.x(), position.y(), self.editor
-        )
-        
-        self.scene.addItem(pred_item)
+        pred_id = node.pred_id
+        name = node.name
+        arity = node.arity
+
+        x, y = position
+        pred_item = self._reuse_predicate_item(pred_id, x, y)
+        if pred_item is None:
+            pred_item = PredicateItem(
+                pred_id, name, arity, x, y, self.editor,
+                text_mode=self.text_mode
+            )
+            self._add_item(pred_item)
         self.graphics_items[pred_id] = pred_item
+
+        return [pred_item]
         
-        return pred_item
-        
-    def _render_conjunction(self, expr_result, position):
-        """Render conjunction - place items horizontally."""
-        conjuncts = expr_result['conjuncts']
-        rendered_items = []
-        
-        # Calculate positions for conjuncts
-        total_width = len(conjuncts) * self.predicate_spacing
-        start_x = position.x() - total_width / 2
-        
-        for i, conjunct in enumerate(conjuncts):
-            item_pos = QPointF(start_x + i * self.predicate_spacing, position.y())
-            item = self._render_expression_tree(conjunct, item_pos)
-            if item:
-                if isinstance(item, list):
-                    rendered_items.extend(item)
-                else:
-                    rendered_items.append(item)
-                
-        return rendered_items
-        
-    def _render_negation(self, expr_result, position):
-        """Render negation as a cut."""
-        cut_id = expr_result['cut_id']
-        
-        # Render the negated content first to determine cut size
-        inner_items = []
-        if 'negated' in expr_result:
-            inner_item = self._render_expression_tree(expr_result['negated'], position)
-            if inner_item:
-                if isinstance(inner_item, list):
-                    inner_items.extend(inner_item)
-                else:
-                    inner_items.append(inner_item)
-        
+    def _materialize_cut(self, node, position, inner_bbox):
+        """Create the cut item around a rendered negation's inner bounds.
+
+        inner_bbox is the analytically folded (minx, miny, maxx, maxy)
+        of the inner items, so no Qt geometry calls are needed here.
+        """
+        cut_id = node.cut_id
+
         # Calculate cut bounds based on inner items
-        if inner_items:
-            bounds = self._calculate_items_bounds(inner_items)
-            cut_x = bounds.x() - self.cut_padding
-            cut_y = bounds.y() - self.cut_padding
-            cut_width = bounds.width() + 2 * self.cut_padding
-            cut_height = bounds.height() + 2 * self.cut_padding
+        if inner_bbox is not None:
+            minx, miny, maxx, maxy = inner_bbox
+            cut_x = minx - self.cut_padding
+            cut_y = miny - self.cut_padding
+            cut_width = (maxx - minx) + 2 * self.cut_padding
+            cut_height = (maxy - miny) + 2 * self.cut_padding
         else:
             # Default cut size
-            cut_x = position.x() - 50
-            cut_y = position.y() - 30
+            x, y = position
+            cut_x = x - 50
+            cut_y = y - 30
             cut_width = 100
             cut_height = 60
-        
-        cut_item = CutItem(cut_id, cut_x, cut_y, cut_width, cut_height, self.editor)
-        self.scene.addItem(cut_item)
+
+        cut_item = self._recycle.pop(cut_id, None)
+        if cut_item is not None and cut_item.pos().isNull():
+            # Renderer-placed cuts keep pos at the origin and carry all
+            # geometry in the rect, so reuse is a single setRect
+            cut_item.setRect(cut_x, cut_y, cut_width, cut_height)
+        else:
+            if cut_item is not None:
+                # User-dragged cut: rebuilding is simpler than undoing
+                # the translation through the position validator
+                self.scene.removeItem(cut_item)
+            cut_item = CutItem(cut_id, cut_x, cut_y, cut_width, cut_height, self.editor)
+            self._add_item(cut_item)
         self.graphics_items[cut_id] = cut_item
-        
-        return cut_item
-        
-    def _render_existential(self, expr_result, position):
-        """Render existential quantification (implicit in EG)."""
-        return self._render_expression_tree(expr_result['body'], position)
-        
-    def _render_equality(self, expr_result, position):
+
+        return [cut_item], (cut_x, cut_y, cut_x + cut_width, cut_y + cut_height)
+
+    def _render_equality(self, nodes, node, position):
         """Render equality with corrected merged line representation."""
-        var1 = expr_result['variable1']
-        var2 = expr_result['variable2']
-        shared_line_id = expr_result['shared_line_id']
-        
+        var1, var2 = node.variables
+        shared_line_id = node.line_id
+
         # Create a single line representing both variables
         line_item = LineOfIdentityItem(shared_line_id, f"{var1}={var2}")
-        line_item.setPos(position)
+        line_item.setPos(position[0], position[1])
         line_item.end_point = QPointF(50, 0)  # Longer line for equality
         
-        self.scene.addItem(line_item)
+        self._add_item(line_item)
         self.line_items[shared_line_id] = line_item
+        return [line_item]
     
-    def _create_visible_lines_of_identity(self, variable_map, hook_connections):
-        """Create visible lines of identity that properly connect to predicate hooks."""
-        # Group hook connections by variable (line ID)
-        line_to_hooks = {}
-        
-        for (pred_id, hook_index), line_id in hook_connections.items():
-            if line_id not in line_to_hooks:
-                line_to_hooks[line_id] = []
-            line_to_hooks[line_id].append((pred_id, hook_index))
-        
+    def _create_visible_lines_of_identity(self, variable_map, line_to_hooks):
+        """Create visible lines of identity that properly connect to predicate hooks.
+
+        line_to_hooks is the per-render reverse index prepared by
+        render_from_parse_result.
+        """
         # Create lines of identity for each variable
         for var_name, line_id in variable_map.items():
             if line_id not in self.line_items:
@@ -204,7 +472,7 @@ class EGRenderer:
                     # No hook connections - create standalone line
                     line_item = StandaloneLineOfIdentityItem(line_id, var_name)
                     line_item.setPos(QPointF(0, 0))
-                    self.scene.addItem(line_item)
+                    self._add_item(line_item)
                     self.line_items[line_id] = line_item
                     
                 elif len(hook_list) == 1:
@@ -215,7 +483,7 @@ class EGRenderer:
                     if pred_item:
                         line_item = StandaloneLineOfIdentityItem(line_id, var_name, pred_item, hook_index)
                         # The line will position itself based on the hook
-                        self.scene.addItem(line_item)
+                        self._add_item(line_item)
                         self.line_items[line_id] = line_item
                         
                         # Establish the connection
@@ -235,122 +503,299 @@ class EGRenderer:
                             connected_predicates.append((pred_item, hook_index))
                     
                     # The line will position itself based on the hook connections
-                    self.scene.addItem(line_item)
+                    self._add_item(line_item)
                     self.line_items[line_id] = line_item
     
-    def _find_predicates_for_line_via_hooks(self, line_id, hook_connections):
-        """Find predicates connected to a line via hook connections."""
-        connected = []
-        
-        for (pred_id, hook_index), connected_line_id in hook_connections.items():
-            if connected_line_id == line_id:
-                pred_item = self.graphics_items.get(pred_id)
-                if pred_item:
-                    connected.append((pred_item, hook_index))
-        
-        return connected
+    def _find_predicates_for_line_via_hooks(self, line_id):
+        """Find predicates connected to a line via the per-render reverse index."""
+        return [(self.graphics_items[pred_id], hook_index)
+                for pred_id, hook_index in self._line_to_hooks.get(line_id, ())
+                if pred_id in self.graphics_items]
     
-    def _create_proper_ligatures(self, parse_result):
-        """Create ligatures with proper hook-to-hook connections."""
-        hook_connections = parse_result.get('hook_connections', {})
-        
-        # Group hook connections by line ID
-        line_to_hooks = {}
-        for (pred_id, hook_index), line_id in hook_connections.items():
-            if line_id not in line_to_hooks:
-                line_to_hooks[line_id] = []
-            line_to_hooks[line_id].append((pred_id, hook_index))
-        
-        # Create ligatures for lines with multiple hook connections
+    def _create_proper_ligatures(self, line_to_hooks):
+        """Create ligatures with proper hook-to-hook connections.
+
+        line_to_hooks is the per-render reverse index prepared by
+        render_from_parse_result.
+        """
+        # Collect ligatures for lines with multiple hook connections
+        batch_item = None
+        if self.batch_mode:
+            batch_item = BatchLigatureItem(self.editor)
+
         for line_id, hook_list in line_to_hooks.items():
             if len(hook_list) > 1:
-                # Create ligature connecting these hooks
                 ligature_id = f"lig_{line_id}"
-                ligature_item = LigatureItem(ligature_id, self.editor)
-                
-                # Connect to specific hooks
-                for pred_id, hook_index in hook_list:
-                    pred_item = self.graphics_items.get(pred_id)
-                    if pred_item:
+                hook_items = [
+                    (self.graphics_items[pred_id], hook_index)
+                    for pred_id, hook_index in hook_list
+                    if pred_id in self.graphics_items
+                ]
+
+                if batch_item is not None:
+                    # Batched path: one shared item draws every segment
+                    batch_item.add_ligature(ligature_id, hook_items)
+                    self.ligature_items[ligature_id] = batch_item
+                else:
+                    # Create ligature connecting these hooks
+                    ligature_item = LigatureItem(ligature_id, self.editor)
+                    for pred_item, hook_index in hook_items:
                         ligature_item.connect_to_hook(pred_item, hook_index)
-                
-                self.scene.addItem(ligature_item)
-                self.ligature_items[ligature_id] = ligature_item
+
+                    self._add_item(ligature_item)
+                    self.ligature_items[ligature_id] = ligature_item
+
+        if batch_item is not None and batch_item.ligature_hooks:
+            self._add_item(batch_item)
     
     def _calculate_items_bounds(self, items):
         """Calculate the bounding rectangle of a list of graphics items."""
         if not items:
             return QRectF(0, 0, 0, 0)
-        
-        bounds = items[0].sceneBoundingRect()
-        for item in items[1:]:
-            bounds = bounds.united(item.sceneBoundingRect())
-        
-        return bounds
+
+        # Fold the union in one reduce call; the per-step united() runs
+        # in C++ without a Python-level loop body
+        return reduce(QRectF.united,
+                      (item.sceneBoundingRect() for item in items))
         
     def _optimize_layout(self):
         """Optimize the layout to minimize overlaps and improve readability."""
         # Separate items by type
         predicates = []
         cuts = []
-        lines = []
-        
+
+        # Branch on the integer KIND tag instead of hasattr probing
         for item in self.graphics_items.values():
-            if hasattr(item, 'predicate_id'):
+            if item.KIND == PredicateItem.KIND:
                 predicates.append(item)
-            elif hasattr(item, 'cut_id'):
+            elif item.KIND == CutItem.KIND:
                 cuts.append(item)
-        
-        for item in self.line_items.values():
-            lines.append(item)
-        
-        # Adjust predicate positions to avoid overlaps
-        self._resolve_predicate_overlaps(predicates)
-        
+
+        # Order predicates by containing context, then x, so array
+        # neighbors in the separation pass are also spatial neighbors
+        # (coherent position arrays, denser grid cells)
+        predicates.sort(key=lambda p: (
+            self.editor.get_parent_context(p.predicate_id) or '',
+            p.pos().x()))
+
+        # Adjust predicate positions to avoid overlaps; only predicates
+        # that actually moved make their lines/ligatures dirty
+        moved = self._resolve_predicate_overlaps(predicates)
+        self._refresh_dirty_attachments(moved)
+
+    def _refresh_dirty_attachments(self, moved):
+        """Re-route lines and ligatures touching the moved predicates."""
+        if not moved:
+            return
+
+        # Lines whose hooks sit on a moved predicate (via the per-render
+        # reverse index); everything else keeps its creation-time path
+        dirty_lines = {
+            line_id
+            for line_id, hooks in self._line_to_hooks.items()
+            for pred_id, _ in hooks
+            if pred_id in moved
+        }
+
         # Update line positions
-        for line in lines:
-            if hasattr(line, 'update_position_from_hooks'):
+        for line_id in dirty_lines:
+            line = self.line_items.get(line_id)
+            if line is not None and hasattr(line, 'update_position_from_hooks'):
                 line.update_position_from_hooks()
-        
-        # Update ligature paths
-        for ligature in self.ligature_items.values():
+
+        # Update ligature paths (the batch item may be mapped under many IDs)
+        for ligature in {self.ligature_items[f"lig_{line_id}"]
+                         for line_id in dirty_lines
+                         if f"lig_{line_id}" in self.ligature_items}:
             ligature.update_path()
-            
+
+    def _layout_key(self):
+        """Structural hash of the editor model (object ids + parent links).
+
+        Any mutation through EGEditor either introduces new ids or
+        rewrites a parent_id, so a stale cache entry can never collide
+        with the current graph - no explicit invalidation hook needed.
+        """
+        return hash(tuple(sorted(
+            (obj_id, obj.parent_id)
+            for obj_id, obj in self.editor.model.objects.items())))
+
+    def _apply_cached_layout(self, positions):
+        """Reapply cached final predicate positions, skipping separation."""
+        moved = set()
+        for pred_id, (x, y) in positions.items():
+            item = self.graphics_items.get(pred_id)
+            if item is None:
+                continue
+            pos = item.pos()
+            if pos.x() != x or pos.y() != y:
+                item.setPos(x, y)
+                moved.add(pred_id)
+        self._refresh_dirty_attachments(moved)
+
     def _resolve_predicate_overlaps(self, predicates):
-        """Resolve overlapping predicates by adjusting positions."""
+        """Resolve overlapping predicates by adjusting positions.
+
+        Returns the set of predicate ids that were displaced.
+        """
         if len(predicates) < 2:
-            return
-            
-        # Simple force-based separation
-        for i in range(len(predicates)):
-            for j in range(i + 1, len(predicates)):
+            return set()
+
+        if np is not None:
+            return self._resolve_overlaps_vectorized(predicates)
+
+        # Simple force-based separation. Rects are snapshot once up
+        # front (sceneBoundingRect walks Qt's index per call) and kept
+        # in sync by translating the cached copy whenever an item moves.
+        rects = [p.sceneBoundingRect() for p in predicates]
+
+        # Sweep and prune along x: walk items in order of interval start,
+        # keeping an active list of items whose x-interval can still
+        # reach the sweep line. Only those candidates get the full
+        # intersection test, so sparse scenes stay near-linear
+        intervals = sorted(
+            (rects[i].left(), rects[i].right(), i)
+            for i in range(len(rects)))
+        active = []
+        moved = set()
+        for left, _right, i in intervals:
+            active = [j for j in active if rects[j].right() >= left]
+            for j in active:
+                self._separate_pair(predicates, rects, j, i, moved)
+            active.append(i)
+        return moved
+
+    def _separate_pair(self, predicates, rects, i, j, moved):
+        """Push one candidate pair apart if their cached rects overlap."""
+        rect1 = rects[i]
+        rect2 = rects[j]
+
+        if rect1.intersects(rect2):
+            # Calculate separation vector
+            center1 = rect1.center()
+            center2 = rect2.center()
+
+            dx = center2.x() - center1.x()
+            dy = center2.y() - center1.y()
+
+            # Squared-distance coincidence test; no abs or sqrt needed
+            if dx * dx + dy * dy < 1.0:
+                dx, dy = 80, 0  # Default separation
+
+            # Normalize and scale; hypot is overflow-safe and the single
+            # reciprocal replaces the two per-axis divisions
+            length = math.hypot(dx, dy)
+            if length > 0:
+                inv = 1.0 / length
+                dx *= 90.0 * inv
+                dy *= 50.0 * inv
+
+                # Move items apart via the float setPos overload; no
+                # intermediate QPointF per pair
                 item1, item2 = predicates[i], predicates[j]
-                
-                # Check if items overlap
-                rect1 = item1.sceneBoundingRect()
-                rect2 = item2.sceneBoundingRect()
-                
-                if rect1.intersects(rect2):
-                    # Calculate separation vector
-                    center1 = rect1.center()
-                    center2 = rect2.center()
-                    
-                    dx = center2.x() - center1.x()
-                    dy = center2.y() - center1.y()
-                    
-                    if abs(dx) < 1 and abs(dy) < 1:
-                        dx, dy = 80, 0  # Default separation
-                    
-                    # Normalize and scale
-                    length = math.sqrt(dx*dx + dy*dy)
-                    if length > 0:
-                        dx = (dx / length) * 90
-                        dy = (dy / length) * 50
-                        
-                        # Move items apart
-                        item1.setPos(item1.pos() - QPointF(dx/2, dy/2))
-                        item2.setPos(item2.pos() + QPointF(dx/2, dy/2))
-    
+                p1, p2 = item1.pos(), item2.pos()
+                item1.setPos(p1.x() - dx/2, p1.y() - dy/2)
+                item2.setPos(p2.x() + dx/2, p2.y() + dy/2)
+                rects[i] = rect1.translated(-dx/2, -dy/2)
+                rects[j] = rect2.translated(dx/2, dy/2)
+                moved.add(item1.predicate_id)
+                moved.add(item2.predicate_id)
+
+    # Force-directed separation parameters: iteration cap, convergence
+    # threshold, and the starting step size for the cooling schedule
+    _LAYOUT_MAX_ITERS = 10
+    _LAYOUT_EPSILON = 0.5
+    _LAYOUT_START_TEMP = 90.0
+
+    def _resolve_overlaps_vectorized(self, predicates):
+        """Separate overlapping predicates with an iterated NumPy pass.
+
+        Centers and half-extents are snapshot into arrays once; each
+        iteration computes pairwise deltas and AABB overlap as broadcast
+        matrix ops and moves the centers in-array, with a cooling
+        schedule clipping per-step displacement so the layout settles
+        instead of oscillating. Qt is only touched at the very end, with
+        one setPos per item that actually moved.
+        """
+        rects = [p.sceneBoundingRect() for p in predicates]
+        cx = np.array([r.center().x() for r in rects], dtype=np.float32)
+        cy = np.array([r.center().y() for r in rects], dtype=np.float32)
+        hw = np.array([r.width() for r in rects], dtype=np.float32) * 0.5
+        hh = np.array([r.height() for r in rects], dtype=np.float32) * 0.5
+        sum_hw = hw[:, None] + hw[None, :]
+        sum_hh = hh[:, None] + hh[None, :]
+
+        total_x = np.zeros(len(predicates), dtype=np.float32)
+        total_y = np.zeros(len(predicates), dtype=np.float32)
+
+        # Antisymmetric sign matrix for the coincident-centers fallback:
+        # the lower-indexed item of a pair goes left, the other right.
+        # A symmetric +80 would push both the same way, so they would
+        # translate together and never separate.
+        idx = np.arange(len(predicates))
+        sgn = np.sign(idx[None, :] - idx[:, None]).astype(np.float32)
+
+        if _separate is not None:
+            # JIT-compiled kernel: same math, no temporary pair matrices
+            _separate(cx, cy, hw, hh, total_x, total_y,
+                      self._LAYOUT_MAX_ITERS,
+                      np.float32(self._LAYOUT_EPSILON),
+                      np.float32(self._LAYOUT_START_TEMP))
+            moved = set()
+            for item, ox, oy in zip(predicates, total_x, total_y):
+                if ox or oy:
+                    p = item.pos()
+                    item.setPos(p.x() + float(ox), p.y() + float(oy))
+                    moved.add(item.predicate_id)
+            return moved
+
+        max_iters = self._LAYOUT_MAX_ITERS
+        for it in range(max_iters):
+            dx = cx[None, :] - cx[:, None]
+            dy = cy[None, :] - cy[:, None]
+            overlap = (np.abs(dx) < sum_hw) & (np.abs(dy) < sum_hh)
+            np.fill_diagonal(overlap, False)
+            if not overlap.any():
+                break
+
+            # Coincident centers get the same default separation as the
+            # scalar path's dx, dy = 80, 0: a fixed horizontal push,
+            # signed per pair so the two members move apart
+            degenerate = overlap & (dx * dx + dy * dy < 1.0)
+            dx = np.where(degenerate, np.float32(80.0) * sgn, dx)
+            dy = np.where(degenerate, np.float32(0.0), dy)
+            length = np.hypot(dx, dy)
+            length[length == 0] = 1.0
+            fx = np.where(overlap, dx / length * 90.0, 0.0)
+            fy = np.where(overlap, dy / length * 50.0, 0.0)
+
+            # fx[i, j] points from i toward j, so i retreats along -fx;
+            # halved because both members of a pair share the separation
+            step_x = fx.sum(axis=1, dtype=np.float32) * np.float32(-0.5)
+            step_y = fy.sum(axis=1, dtype=np.float32) * np.float32(-0.5)
+            magnitude = np.hypot(step_x, step_y)
+            if magnitude.max() < self._LAYOUT_EPSILON:
+                break
+
+            # Cooling: allow big corrective moves early, small ones late
+            temp = self._LAYOUT_START_TEMP * (1.0 - it / max_iters)
+            scale = np.where(magnitude > temp,
+                             temp / np.maximum(magnitude, 1e-6), 1.0)
+            step_x *= scale
+            step_y *= scale
+            cx += step_x
+            cy += step_y
+            total_x += step_x
+            total_y += step_y
+
+        moved = set()
+        for item, ox, oy in zip(predicates, total_x, total_y):
+            if ox or oy:
+                p = item.pos()
+                item.setPos(p.x() + float(ox), p.y() + float(oy))
+                moved.add(item.predicate_id)
+        return moved
+
     def set_mode(self, mode):
         """Set interaction mode for all rendered items."""
         for item in self.graphics_items.values():
@@ -3,10 +3,11 @@ Graphics Items for Existential Graphs
 Addresses all remaining issues with hook positioning and containment validation.
 """
 
-from PySide6.QtWidgets import (QGraphicsItem, QGraphicsEllipseItem, QGraphicsTextItem, 
-                              QGraphicsPathItem, QGraphicsRectItem)
-from PySide6.QtGui import QPen, QBrush, QPainterPath, QColor, QPainter, QPolygonF
-from PySide6.QtCore import Qt, QPointF, QRectF, Signal, QObject
+from PySide6.QtWidgets import (QGraphicsItem, QGraphicsEllipseItem, QGraphicsTextItem,
+                              QGraphicsPathItem, QGraphicsPixmapItem, QGraphicsRectItem)
+from PySide6.QtGui import (QPen, QBrush, QPainterPath, QColor, QFont, QFontMetricsF,
+                           QPainter, QPixmap, QPolygonF)
+from PySide6.QtCore import Qt, QPointF, QLineF, QRectF, Signal, QObject
 from line_of_identity_item import LineOfIdentityItem, StandaloneLineOfIdentityItem
 import math
 
@@ -136,6 +137,29 @@ class ConstraintValidator:
             current = editor.get_parent_context(current)
         return False
 
+# Rasterized predicate labels, keyed by label text. Each unique label is
+# laid out and painted once; every item showing it blits the same pixmap.
+_label_pixmap_cache = {}
+
+def get_label_pixmap(label):
+    """Return a cached pixmap of the label in the standard predicate font."""
+    pixmap = _label_pixmap_cache.get(label)
+    if pixmap is None:
+        font = QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        metrics = QFontMetricsF(font)
+        rect = metrics.boundingRect(label).adjusted(-2, -2, 2, 2)
+        pixmap = QPixmap(int(rect.width()), int(rect.height()))
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setFont(font)
+        painter.setPen(QColor(0, 0, 0))
+        painter.drawText(pixmap.rect(), Qt.AlignCenter, label)
+        painter.end()
+        _label_pixmap_cache[label] = pixmap
+    return pixmap
+
 class HookItem(QGraphicsEllipseItem):
     """Hook item - very small and properly positioned."""
     
@@ -174,28 +198,40 @@ class HookItem(QGraphicsEllipseItem):
             self.setPen(QPen(QColor(100, 100, 100), 1))  # Gray border
 
 class PredicateItem(QGraphicsItem):
+    # Small integer type tag (matches the eg_model KIND convention);
+    # cheaper to branch on than hasattr/isinstance
+    KIND = 1
+
     """Predicate item with perfect hook positioning and validation."""
     
-    def __init__(self, predicate_id, label, hook_count, x, y, editor=None, parent=None):
+    def __init__(self, predicate_id, label, hook_count, x, y, editor=None, parent=None,
+                 text_mode='text'):
         super().__init__(parent)
         self.predicate_id = predicate_id
         self.node_id = predicate_id
         self.editor = editor
+        # Set by EGRenderer._add_item; moves bump its mutation_gen so
+        # generation-keyed caches (e.g. the view's bounding rect) refresh
+        self.renderer = None
         self.mode = InteractionMode.CONSTRAINED
-        
+
         self.setPos(x, y)
         self.setFlag(QGraphicsItem.ItemIsMovable, True)
         self.setFlag(QGraphicsItem.ItemIsSelectable, True)
         self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
         self.setZValue(2)
-        
-        # Create text item
-        self.text = QGraphicsTextItem(label, self)
-        font = self.text.font()
-        font.setPointSize(12)
-        font.setBold(True)
-        self.text.setFont(font)
-        
+
+        if text_mode == 'pixmap':
+            # Blit a shared, pre-rasterized label instead of laying out glyphs
+            self.text = QGraphicsPixmapItem(get_label_pixmap(label), self)
+        else:
+            # Create text item
+            self.text = QGraphicsTextItem(label, self)
+            font = self.text.font()
+            font.setPointSize(12)
+            font.setBold(True)
+            self.text.setFont(font)
+
         # Calculate text bounds for hook positioning
         self.text_rect = self.text.boundingRect()
         
@@ -282,7 +318,10 @@ class PredicateItem(QGraphicsItem):
             for line in self.connected_lines:
                 if hasattr(line, 'update_position_from_hooks'):
                     line.update_position_from_hooks()
-                
+
+            if self.renderer is not None:
+                self.renderer.mutation_gen += 1
+
         return super().itemChange(change, value)
     
     def boundingRect(self):
@@ -322,6 +361,8 @@ class PredicateItem(QGraphicsItem):
             )
 
 class CutItem(QGraphicsEllipseItem):
+    KIND = 2
+
     """Cut item with enhanced containment validation."""
     
     def __init__(self, cut_id, x, y, width, height, editor=None, parent=None):
@@ -329,6 +370,9 @@ class CutItem(QGraphicsEllipseItem):
         self.cut_id = cut_id
         self.node_id = cut_id
         self.editor = editor
+        # Set by EGRenderer._add_item; moves bump its mutation_gen so
+        # generation-keyed caches (e.g. the view's bounding rect) refresh
+        self.renderer = None
         self.mode = InteractionMode.CONSTRAINED
         
         # Visual styling
@@ -365,10 +409,16 @@ class CutItem(QGraphicsEllipseItem):
         if change == QGraphicsItem.ItemPositionChange:
             if not ConstraintValidator.is_position_valid(self, value, self.mode, self.editor):
                 return self.pos()
-                
+
+        elif change == QGraphicsItem.ItemPositionHasChanged:
+            if self.renderer is not None:
+                self.renderer.mutation_gen += 1
+
         return super().itemChange(change, value)
 
 class LigatureItem(QGraphicsPathItem):
+    KIND = 4
+
     """Ligature item with proper hook-to-hook connections."""
     
     def __init__(self, ligature_id, editor=None, parent=None):
@@ -470,6 +520,74 @@ class LigatureItem(QGraphicsPathItem):
         painter.setPen(pen)
         painter.drawPath(self.path())
 
+class BatchLigatureItem(QGraphicsItem):
+    KIND = 4
+
+    """All straight ligature segments drawn in one paint call.
+
+    Instead of one QGraphicsPathItem per ligature, this item collects the
+    segments of every ligature into a single QLineF list and draws them
+    with one painter.drawLines call - one paint dispatch for the whole
+    scene's ligatures.
+    """
+
+    def __init__(self, editor=None, parent=None):
+        super().__init__(parent)
+        self.editor = editor
+        self.mode = InteractionMode.CONSTRAINED
+
+        # One entry per ligature: list of (predicate_item, hook_index) tuples
+        self.ligature_hooks = {}
+
+        self._segments = []
+        self._bounds = QRectF()
+        self._pen = QPen(QColor(0, 0, 0), 2)
+        self.setZValue(1)
+
+    def set_mode(self, mode):
+        """Set the interaction mode."""
+        self.mode = mode
+
+    def add_ligature(self, ligature_id, hook_list):
+        """Register a ligature's hook connections for batched drawing."""
+        self.ligature_hooks[ligature_id] = list(hook_list)
+        for predicate_item, hook_index in hook_list:
+            if hook_index in predicate_item.hooks:
+                predicate_item.hooks[hook_index].set_connected(True)
+            if hasattr(predicate_item, 'add_connected_ligature'):
+                predicate_item.add_connected_ligature(self)
+        self.update_path()
+
+    def update_path(self):
+        """Rebuild the segment list from current hook positions."""
+        self.prepareGeometryChange()
+        self._segments = []
+        for hook_list in self.ligature_hooks.values():
+            if len(hook_list) < 2:
+                continue
+            positions = [
+                self.mapFromScene(predicate_item.get_hook_scene_position(hook_index))
+                for predicate_item, hook_index in hook_list
+            ]
+            for start, end in zip(positions, positions[1:]):
+                self._segments.append(QLineF(start, end))
+
+        bounds = QRectF()
+        for segment in self._segments:
+            bounds = bounds.united(QRectF(segment.p1(), segment.p2()).normalized())
+        self._bounds = bounds.adjusted(-2, -2, 2, 2)
+        self.update()
+
+    def boundingRect(self):
+        """Return the precomputed union of all segments."""
+        return self._bounds
+
+    def paint(self, painter, option, widget):
+        """Paint every ligature segment in a single drawLines call."""
+        if self._segments:
+            painter.setPen(self._pen)
+            painter.drawLines(self._segments)
+
 # Example usage and testing
 if __name__ == "__main__":
     from PySide6.QtWidgets import QApplication, QGraphicsView, QGraphicsScene
@@ -11,6 +11,9 @@ from PySide6.QtCore import Qt, QPointF, QRectF
 import math
 
 class LineOfIdentityItem(QGraphicsItem):
+    # Integer type tag, matching the eg_model/graphics_items convention
+    KIND = 3
+
     """
     Line of identity that properly connects to predicate hooks.
     Always visible and positioned to show variable connections.
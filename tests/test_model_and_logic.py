@@ -1,6 +1,6 @@
 import unittest
 from eg_editor import EGEditor
-from eg_model import LineOfIdentity
+from eg_model import Ligature, LineOfIdentity
 
 class TestModelAndLogic(unittest.TestCase):
     def setUp(self):
@@ -72,4 +72,70 @@ class TestModelAndLogic(unittest.TestCase):
         self.editor.connect([(p_id, 1), (q_id, 1), (r_id, 1)])
         final_line_id = self.model.get_object(p_id).hooks[1]
         self.assertEqual(final_line_id, self.model.get_object(q_id).hooks[1])
-        self.assertEqual(final_line_id, self.model.get_object(r_id).hooks[1])
\ No newline at end of file
+        self.assertEqual(final_line_id, self.model.get_object(r_id).hooks[1])
+    def test_children_order_and_membership(self):
+        """Tests that context children keep insertion order with set-like membership."""
+        sheet = self.model.sheet_of_assertion
+        a = self.editor.add_predicate('A', 0)
+        b = self.editor.add_predicate('B', 0)
+        c = self.editor.add_predicate('C', 0)
+        self.assertEqual(sheet.children, [a, b, c])
+
+        # Re-adding an existing child is a no-op
+        sheet.add_child(a)
+        self.assertEqual(sheet.children, [a, b, c])
+
+        self.assertTrue(sheet.has_child(b))
+        sheet.remove_child(b)
+        self.assertEqual(sheet.children, [a, c])
+        self.assertFalse(sheet.has_child(b))
+
+    def test_ligature_attachment_arrays(self):
+        """Tests the parallel attachment arrays and their deduplication."""
+        ligature = Ligature('line-1')
+        ligature.add_attachment('p', 1)
+        ligature.add_attachment('q', 2)
+        ligature.add_attachment('p', 1)  # duplicate, ignored
+
+        self.assertEqual(ligature.attachment_preds, ['p', 'q'])
+        self.assertEqual(ligature.attachment_hooks, [1, 2])
+        self.assertEqual(ligature.attachments, [('p', 1), ('q', 2)])
+
+    def test_add_predicates_batch(self):
+        """Tests that add_predicates creates predicates in order under the right parents."""
+        cut_id = self.editor.add_cut()
+        ids = self.editor.add_predicates(
+            [('P', 1, 'SA'), ('Q', 2, cut_id), ('R', 0, cut_id)])
+
+        self.assertEqual(len(ids), 3)
+        labels = [self.model.get_object(i).label for i in ids]
+        self.assertEqual(labels, ['P', 'Q', 'R'])
+        self.assertEqual(self.editor.get_parent_context(ids[0]), 'SA')
+        self.assertEqual(self.editor.get_parent_context(ids[1]), cut_id)
+        self.assertEqual(self.model.get_object(cut_id).children, [ids[1], ids[2]])
+        self.assertEqual(len(self.model.get_object(ids[1]).hooks), 2)
+
+        with self.assertRaises(ValueError):
+            self.editor.add_predicates([('X', 1, 'no-such-context')])
+
+    def test_bind_hook_fast_path(self):
+        """Tests that _bind_hook wires a hook to a known line and reuses its ligature."""
+        p_id = self.editor.add_predicate('P', 1)
+        q_id = self.editor.add_predicate('Q', 1)
+        line = LineOfIdentity()
+        self.model.add_object(line)
+
+        lig_id = self.editor._bind_hook(p_id, 1, line.id)
+        self.assertEqual(self.model.get_object(p_id).hooks[1], line.id)
+        self.assertEqual(line.ligatures, {lig_id})
+        ligature = self.model.get_object(lig_id)
+        self.assertEqual(ligature.attachments, [(p_id, 1)])
+
+        # A second bind on the same line reuses the existing ligature
+        self.assertEqual(self.editor._bind_hook(q_id, 1, line.id), lig_id)
+        self.assertEqual(self.model.get_object(q_id).hooks[1], line.id)
+        self.assertEqual(ligature.attachments, [(p_id, 1), (q_id, 1)])
+
+        # The line -> hook reverse index tracks both bindings
+        self.assertEqual(self.model.line_to_hooks[line.id],
+                         {(p_id, 1), (q_id, 1)})
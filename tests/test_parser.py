@@ -71,4 +71,73 @@ class TestClifParser(unittest.TestCase):
         new_clif_string = new_translator.translate()
         
         # 5. Assert that the round-trip result is identical
-        self.assertEqual(clif_string, new_clif_string)
\ No newline at end of file
+        self.assertEqual(clif_string, new_clif_string)
+    def test_flat_node_ast_shape(self):
+        """Tests that parse() returns a flat node list with index-based children."""
+        result = self.parser.parse("(and (Cat x) (not (Dog y)))")
+        self.assertTrue(result['success'])
+
+        nodes = result['nodes']
+        root = result['root']
+        self.assertIsInstance(nodes, list)
+        self.assertIs(result['result'], nodes[root])
+        self.assertEqual(nodes[root].kind, 'and')
+
+        # Children are indices into the flat list, not nested structures
+        for child_index in nodes[root].children:
+            self.assertIsInstance(child_index, int)
+        child_kinds = {nodes[i].kind for i in nodes[root].children}
+        self.assertEqual(child_kinds, {'predicate', 'not'})
+
+        # Legacy key access is preserved for shallow consumers
+        self.assertEqual(nodes[root]['type'], 'and')
+        self.assertEqual(nodes[root].get('type'), 'and')
+
+    def test_trailing_tokens_rejected(self):
+        """Tests that input continuing past the root expression fails the parse."""
+        result = self.parser.parse("(Cat x) (Dog y)")
+        self.assertFalse(result['success'])
+        self.assertIn("trailing", result['error'].lower())
+
+    def test_view_vs_snapshot_results(self):
+        """Tests the contract that default results are live views and snapshots are copies."""
+        view = self.parser.parse("(Cat ?x)")['variable_map']
+        self.assertIn('?x', view)
+        with self.assertRaises(TypeError):
+            view['?y'] = 'not-writable'
+
+        snapshot = self.parser.parse("(Cat ?x)", snapshot=True)['variable_map']
+        self.parser.parse("(Dog ?y)")
+
+        # The view tracks the parser's live state; the snapshot does not
+        self.assertNotIn('?x', view)
+        self.assertIn('?y', view)
+        self.assertIn('?x', snapshot)
+
+    def test_compile_and_replay(self):
+        """Tests that BuiltExpr.apply replays a compiled parse onto fresh editors."""
+        built = ClifParser.compile("(exists (?x) (and (P ?x) (not (Q ?x))))")
+
+        editor = EGEditor()
+        result = built.apply(editor)
+        self.assertTrue(result['success'])
+
+        # The replayed model matches what an eager parse would build
+        preds = {obj.label: obj for obj in editor.model.objects.values() if isinstance(obj, Predicate)}
+        cuts = [obj for obj in editor.model.objects.values() if isinstance(obj, Cut)]
+        self.assertEqual(len(cuts), 1)
+        self.assertEqual(editor.get_parent_context(preds['P'].id), 'SA')
+        self.assertEqual(editor.get_parent_context(preds['Q'].id), cuts[0].id)
+        self.assertEqual(preds['P'].hooks[1], preds['Q'].hooks[1])
+
+        # Placeholders were remapped to real ids in every returned map
+        line_id = result['variable_map']['?x']
+        self.assertEqual(line_id, preds['P'].hooks[1])
+        self.assertIn(line_id, editor.model.objects)
+        self.assertIn((preds['P'].id, 1), result['hook_connections'])
+
+        # A second apply builds an independent graph with its own ids
+        other = EGEditor()
+        other_result = built.apply(other)
+        self.assertNotEqual(line_id, other_result['variable_map']['?x'])
+        self.assertNotIn(line_id, other.model.objects)
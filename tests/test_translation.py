@@ -63,4 +63,17 @@ class TestTranslation(unittest.TestCase):
         self.editor.connect([(r_id, 1), (q_id, 1)])
         
         expected = "(exists (?v1) (and (R ?v1) (not (Q ?v1))))"
-        self.assertEqual(self.translator.translate(), expected)
\ No newline at end of file
+        self.assertEqual(self.translator.translate(), expected)
+    def test_repeated_translation_is_stable(self):
+        """Tests that repeated translations agree and editor mutations show through."""
+        p_id = self.editor.add_predicate('P', 1)
+        q_id = self.editor.add_predicate('Q', 1)
+        self.editor.connect([(p_id, 1), (q_id, 1)])
+
+        first = self.translator.translate()
+        self.assertEqual(self.translator.translate(), first)
+
+        # A mutation after translating must be reflected, not served stale
+        r_id = self.editor.add_predicate('R', 1)
+        self.editor.connect([(r_id, 1)])
+        self.assertNotEqual(self.translator.translate(), first)